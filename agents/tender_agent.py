@@ -1,10 +1,10 @@
 import os
-import json
 import uuid
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 
+from utils.serialization import json_dumps
 from utils.tender_crawler import TenderAPIWrapper, EUTenderCrawler
 from vectorstore.cosmos_vector_store import CosmosDBVectorStore
 from llm.azure_recommender_llm import AzureRecommenderLLM
@@ -61,8 +61,8 @@ class TenderAgent:
         # Search for tenders using EU TED API
         logger.info(f"Searching EU TED for tenders with query: '{query}'")
         
-        # Calculate date range
-        end_date = datetime.now()
+        # Calculate date range (day granularity is all the TED API uses)
+        end_date = date.today()
         start_date = end_date - timedelta(days=days_back)
         
         search_results = self.tender_crawler.search_tenders(
@@ -71,8 +71,8 @@ class TenderAgent:
             sources=["eu_ted"],
             country_codes=country_codes,
             cpv_codes=cpv_codes,
-            publication_date_from=start_date.strftime("%Y-%m-%d"),
-            publication_date_to=end_date.strftime("%Y-%m-%d")
+            publication_date_from=start_date.isoformat(),
+            publication_date_to=end_date.isoformat()
         )
         
         if not search_results:
@@ -81,8 +81,8 @@ class TenderAgent:
         
         logger.info(f"Found {len(search_results)} tender search results from EU TED")
         
-        # Process and index tenders
-        indexed_tenders = []
+        # Process tenders, then index them with one batched embedding request
+        enhanced_tenders = []
         for tender_data in search_results:
             try:
                 # Enhance tender data with AI analysis if needed
@@ -94,22 +94,30 @@ class TenderAgent:
                 
                 # Save raw tender data
                 raw_path = os.path.join(self.raw_tenders_dir, f"{tender_id}.json")
-                with open(raw_path, 'w') as f:
-                    json.dump(enhanced_tender, f, indent=2)
-                
-                # Index tender in vector store
-                logger.info(f"Indexing tender: {enhanced_tender.get('title', 'Untitled')}")
-                success = self.vector_store.add_tender(tender_data=enhanced_tender)
+                with open(raw_path, 'wb') as f:
+                    f.write(json_dumps(enhanced_tender, indent=True))
                 
-                if success:
-                    # Add similarity score for display
-                    enhanced_tender["similarity_score"] = 1.0  # Perfect match for newly indexed tenders
-                    indexed_tenders.append(enhanced_tender)
+                enhanced_tenders.append(enhanced_tender)
                     
             except Exception as e:
                 logger.error(f"Error processing tender: {str(e)}")
                 continue
         
+        # Index tenders in vector store
+        logger.info(f"Indexing {len(enhanced_tenders)} tenders")
+        try:
+            indexed_ids = set(self.vector_store.add_tenders_bulk(enhanced_tenders))
+        except Exception as e:
+            logger.error(f"Error indexing tenders: {str(e)}")
+            return []
+        
+        indexed_tenders = []
+        for enhanced_tender in enhanced_tenders:
+            if enhanced_tender["id"] in indexed_ids:
+                # Add similarity score for display
+                enhanced_tender["similarity_score"] = 1.0  # Perfect match for newly indexed tenders
+                indexed_tenders.append(enhanced_tender)
+        
         logger.info(f"Successfully indexed {len(indexed_tenders)} tenders")
         return indexed_tenders
     
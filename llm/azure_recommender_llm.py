@@ -4,6 +4,7 @@ import logging
 from typing import Dict, List, Any, Optional
 from openai import AzureOpenAI
 from vectorstore.cosmos_vector_store import CosmosDBVectorStore
+from utils.serialization import json_loads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -50,7 +51,8 @@ class AzureRecommenderLLM:
             # Search for relevant tenders
             candidate_tenders = self.vector_store.search_tenders(
                 query=search_query,
-                limit=max_recommendations * 2  # Get more candidates for better filtering
+                limit=max_recommendations * 2,  # Get more candidates for better filtering
+                include_full=True  # The match analysis prompt needs the full tender record
             )
             
             if not candidate_tenders:
@@ -102,7 +104,8 @@ class AzureRecommenderLLM:
             # Search for relevant companies
             candidate_companies = self.vector_store.search_companies(
                 query=search_query,
-                limit=max_recommendations * 2
+                limit=max_recommendations * 2,
+                include_full=True  # The match analysis prompt needs the full company record
             )
             
             if not candidate_companies:
@@ -311,7 +314,7 @@ class AzureRecommenderLLM:
             
             if start_idx >= 0 and end_idx > start_idx:
                 json_str = response_text[start_idx:end_idx]
-                analysis = json.loads(json_str)
+                analysis = json_loads(json_str)
                 
                 # Validate required fields
                 if 'match_score' in analysis and 'reasoning' in analysis:
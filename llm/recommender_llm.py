@@ -1,12 +1,13 @@
 import logging
 import requests
-import json
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from openai import AzureOpenAI
 
 from vectorstore.cosmos_vector_store import CosmosDBVectorStore
 from agents.company_agent import CompanyAgent
+from utils.config import render_tender_recommendation
+from utils.serialization import json_dumps, json_loads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -15,7 +16,7 @@ logger = logging.getLogger(__name__)
 class RecommenderLLM:
     """LLM-based tender recommendation engine"""
     
-    def __init__(self, vector_store: ChromaDBStore, config: Dict[str, Any]):
+    def __init__(self, vector_store: CosmosDBVectorStore, config: Dict[str, Any]):
         """
         Initialize the recommender
         
@@ -107,13 +108,16 @@ class RecommenderLLM:
         """
         recommendations = []
         
+        # The company profile is the same for every tender, so serialize it once
+        company_profile_json = json_dumps(company_profile, indent=True).decode("utf-8")
+        
         # Process each tender
         for tender in tenders:
             try:
                 # Create prompt for the LLM
-                prompt = TENDER_RECOMMENDATION_PROMPT.format(
-                    company_profile=json.dumps(company_profile, indent=2),
-                    tender_details=json.dumps(tender, indent=2)
+                prompt = render_tender_recommendation(
+                    company_profile=company_profile_json,
+                    tender_details=json_dumps(tender, indent=True).decode("utf-8")
                 )
                 
                 # Call LLM for matching analysis
@@ -181,7 +185,7 @@ class RecommenderLLM:
                 json_end = response.rfind("}") + 1
                 json_str = response[json_start:json_end]
                 
-                data = json.loads(json_str)
+                data = json_loads(json_str)
                 match_score = float(data.get("match_score", 0))
                 reasoning = data.get("reasoning", "")
                 
@@ -1,6 +1,7 @@
 import streamlit as st
 from datetime import datetime
 import logging
+import hashlib
 from io import StringIO
 from subprocess import run, PIPE
 import os
@@ -41,6 +42,13 @@ def get_document_intelligence_client():
         st.error(f"❌ Failed to initialize Document Intelligence client: {str(e)}")
         return None
 
+# Azure DI results kept per session; the oldest is dropped beyond this
+DI_CACHE_MAX_ENTRIES = 20
+
+def get_file_content_key(file_content):
+    """Build a cache key for uploaded file content"""
+    return hashlib.sha256(file_content).hexdigest()
+
 def process_document_with_azure_di(file_content, filename):
     """Process document using Azure Document Intelligence with native markdown output"""
     try:
@@ -97,20 +105,15 @@ def get_azure_openai_client():
         st.error(f"❌ Failed to initialize Azure OpenAI client: {str(e)}")
         return None
 
-def analyze_tender_with_reasoning_model(tender_content, company_profiles, system_instructions, model_name, reasoning_effort, confidence_threshold=0.7):
+def build_tender_analysis_message(tender_content, company_profiles, confidence_threshold=0.7):
     """
-    Analyze tender content using Azure OpenAI reasoning model
+    Build the user message sent to the reasoning model for a tender
     """
-    try:
-        client = get_azure_openai_client()
-        if not client:
-            return None
-        
-        # Convert confidence threshold to percentage for display
-        threshold_percentage = int(confidence_threshold * 100)
-        
-        # Prepare the user message with tender content and company profiles
-        user_message = f"""
+    # Convert confidence threshold to percentage for display
+    threshold_percentage = int(confidence_threshold * 100)
+    
+    # Prepare the user message with tender content and company profiles
+    user_message = f"""
 **TENDER CONTENT:**
 {tender_content}
 
@@ -126,6 +129,19 @@ For each company, provide:
 
 Format your response as a structured JSON object with "company name", "matching score", "justification", and "recommendations" fields.
 """
+    return user_message
+
+def analyze_tender_with_reasoning_model(tender_content, company_profiles, system_instructions, model_name, reasoning_effort, confidence_threshold=0.7):
+    """
+    Analyze tender content using Azure OpenAI reasoning model
+    """
+    try:
+        client = get_azure_openai_client()
+        if not client:
+            return None
+        
+        # Prepare the user message with tender content and company profiles
+        user_message = build_tender_analysis_message(tender_content, company_profiles, confidence_threshold)
         
         # Call Azure OpenAI reasoning model
         start_time = time.time()
@@ -157,6 +173,112 @@ Format your response as a structured JSON object with "company name", "matching
         st.error(f"❌ Error calling Azure OpenAI reasoning model: {str(e)}")
         return None
 
+def analyze_tenders_in_batch(tender_documents, company_profiles, system_instructions, model_name, reasoning_effort, confidence_threshold=0.7, poll_interval=30):
+    """
+    Analyze each tender separately through the Azure OpenAI Batch API
+    
+    One request per tender is written to a JSONL file keyed by filename, submitted as a
+    batch job and polled until it finishes. Returns a dict of analysis results per filename.
+    """
+    try:
+        client = get_azure_openai_client()
+        if not client:
+            return None
+        
+        # Build one chat completion request per tender document
+        batch_lines = []
+        for filename, content in tender_documents.items():
+            batch_lines.append(json.dumps({
+                "custom_id": filename,
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": {
+                    "model": model_name,
+                    "messages": [
+                        {"role": "developer", "content": system_instructions},
+                        {"role": "user", "content": build_tender_analysis_message(content, company_profiles, confidence_threshold)}
+                    ],
+                    "max_completion_tokens": 5000,
+                    "reasoning_effort": reasoning_effort
+                }
+            }))
+        
+        start_time = time.time()
+        
+        batch_file = client.files.create(
+            file=("tender_batch.jsonl", "\n".join(batch_lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch_job = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/chat/completions",
+            completion_window="24h"
+        )
+        
+        # Poll the batch job until it reaches a terminal state
+        status_placeholder = st.empty()
+        while batch_job.status not in ("completed", "failed", "expired", "cancelled"):
+            status_placeholder.info(f"⏳ Batch {batch_job.id} status: {batch_job.status}")
+            time.sleep(poll_interval)
+            batch_job = client.batches.retrieve(batch_job.id)
+        status_placeholder.empty()
+        
+        if batch_job.status != "completed" or not batch_job.output_file_id:
+            st.error(f"❌ Batch job {batch_job.id} finished with status: {batch_job.status}")
+            return None
+        
+        processing_time = round(time.time() - start_time, 2)
+        
+        # Map each response back to its tender via custom_id
+        batch_results = {}
+        output_text = client.files.content(batch_job.output_file_id).text
+        for line in output_text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response_body = (record.get("response") or {}).get("body") or {}
+            if not response_body.get("choices"):
+                logging.error(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            
+            usage = response_body.get("usage") or {}
+            batch_results[record["custom_id"]] = {
+                "content": response_body["choices"][0]["message"]["content"],
+                "model": response_body.get("model", model_name),
+                "usage": usage or None,
+                "processing_time": processing_time,
+                "reasoning_tokens": (usage.get("completion_tokens_details") or {}).get("reasoning_tokens", 0)
+            }
+        
+        return batch_results
+        
+    except Exception as e:
+        st.error(f"❌ Error running Azure OpenAI batch analysis: {str(e)}")
+        return None
+
+def validate_company_profile_json():
+    """Parse the company profile input once when it changes and cache a compact copy"""
+    parse_company_profile_json(st.session_state.company_profile_input)
+
+def parse_company_profile_json(company_profile_json):
+    """Validate company profile JSON and record the result for that exact text"""
+    st.session_state.company_profile_json = company_profile_json
+    st.session_state.company_profile_validated = company_profile_json
+    st.session_state.company_profile_valid = False
+    st.session_state.company_profile_compact = ""
+    
+    if not company_profile_json:
+        return
+    
+    try:
+        parsed_profiles = json.loads(company_profile_json)
+    except json.JSONDecodeError:
+        return
+    
+    # Compact separators keep the LLM payload small
+    st.session_state.company_profile_valid = True
+    st.session_state.company_profile_compact = json.dumps(parsed_profiles, separators=(",", ":"))
+
 def show_page():
     """
     Reasoning Model Approach page with file uploader and text input field
@@ -213,8 +335,20 @@ def show_page():
                             file_content = uploaded_file.read()
                             uploaded_file.seek(0)  # Reset file pointer
                             
-                            # Process with Azure Document Intelligence
-                            markdown_result = process_document_with_azure_di(file_content, uploaded_file.name)
+                            # Reuse earlier Azure DI output for identical file content
+                            if 'di_cache' not in st.session_state:
+                                st.session_state.di_cache = {}
+                            file_key = get_file_content_key(file_content)
+                            markdown_result = st.session_state.di_cache.get(file_key)
+                            
+                            if markdown_result is None:
+                                # Process with Azure Document Intelligence
+                                markdown_result = process_document_with_azure_di(file_content, uploaded_file.name)
+                                if markdown_result:
+                                    st.session_state.di_cache[file_key] = markdown_result
+                                    if len(st.session_state.di_cache) > DI_CACHE_MAX_ENTRIES:
+                                        # Dicts keep insertion order, so the first key is the oldest
+                                        del st.session_state.di_cache[next(iter(st.session_state.di_cache))]
                             
                             if markdown_result:
                                 # Store result in session state for persistence
@@ -229,10 +363,17 @@ def show_page():
                     if 'processed_documents' in st.session_state and uploaded_file.name in st.session_state.processed_documents:
                         st.subheader("📄 Extracted Content (Markdown)")
                         
-                        # Create tabs for different views
-                        tab_markdown, tab_preview = st.tabs(["📝 Raw Markdown", "👀 Preview"])
+                        # Only the selected view is rendered, so the editable text area
+                        # (a full copy of the markdown sent to the browser) is skipped
+                        # unless the user opens it
+                        view_mode = st.radio(
+                            "View:",
+                            ["👀 Preview", "📝 Raw Markdown"],
+                            horizontal=True,
+                            key=f"view_mode_{file_idx}"
+                        )
                         
-                        with tab_markdown:
+                        if view_mode == "📝 Raw Markdown":
                             # Display raw markdown in a text area for editing
                             markdown_content = st.text_area(
                                 "Processed content (editable):",
@@ -243,18 +384,17 @@ def show_page():
                             
                             # Update session state if user edits
                             st.session_state.processed_documents[uploaded_file.name] = markdown_content
-                            
-                            # Download button for markdown
-                            st.download_button(
-                                label="💾 Download Markdown",
-                                data=markdown_content,
-                                file_name=f"{uploaded_file.name}_processed.md",
-                                mime="text/markdown"
-                            )
-                        
-                        with tab_preview:
+                        else:
                             # Display rendered markdown
                             st.markdown(st.session_state.processed_documents[uploaded_file.name])
+                        
+                        # Download button for markdown
+                        st.download_button(
+                            label="💾 Download Markdown",
+                            data=st.session_state.processed_documents[uploaded_file.name],
+                            file_name=f"{uploaded_file.name}_processed.md",
+                            mime="text/markdown"
+                        )
                     
                     # Show basic preview for text files (fallback)
                     elif uploaded_file.type == "text/plain":
@@ -283,6 +423,9 @@ def show_page():
         # Initialize session state for company profile JSON if not exists
         if 'company_profile_json' not in st.session_state:
             st.session_state.company_profile_json = ""
+            st.session_state.company_profile_validated = ""
+            st.session_state.company_profile_valid = False
+            st.session_state.company_profile_compact = ""
         
         # Text input field
         company_profile_json = st.text_area(
@@ -291,7 +434,8 @@ def show_page():
             placeholder="use your Excel Copilot to convert the company profile table into JSON...",
             height=550,
             help="Provide specific questions or instructions for the AI reasoning model",
-            key="company_profile_input"
+            key="company_profile_input",
+            on_change=validate_company_profile_json
         )
         
         # Update session state when user types
@@ -328,117 +472,155 @@ Your output should include a matching score from 0% to 100% for each company, an
             help="Minimum confidence level for AI responses"
         )
         
+        batch_mode = st.checkbox(
+            "Analyze in Batch",
+            value=False,
+            help="Analyze each tender separately via the Azure OpenAI Batch API (lower cost, results may take longer)"
+        )
+        
         # Process button
         col_btn1, col_btn2 = st.columns(2)
         
         with col_btn1:
             if st.button("🚀 Process with AI", type="primary", use_container_width=True):
                 if uploaded_files and company_profile_json:
-                    # Validate company profile JSON
-                    if company_profile_json:
-                        try:
-                            json.loads(company_profile_json)
-                        except json.JSONDecodeError:
-                            st.error("❌ Invalid JSON format in Company Profile. Please check your JSON syntax.")
-                            st.stop()
+                    # Company profile JSON is validated when the input changes; re-parse if that
+                    # result is for other text (e.g. Clear All reset it while the input kept its text)
+                    if st.session_state.get("company_profile_validated") != company_profile_json:
+                        parse_company_profile_json(company_profile_json)
+                    if not st.session_state.company_profile_valid:
+                        st.error("❌ Invalid JSON format in Company Profile. Please check your JSON syntax.")
+                        st.stop()
                     
-                    # Collect all processed tender content
-                    all_tender_content = ""
-                    if 'processed_documents' in st.session_state and st.session_state.processed_documents:
-                        for filename, content in st.session_state.processed_documents.items():
-                            all_tender_content += f"\n\n--- {filename} ---\n{content}"
-                    else:
+                    if 'processed_documents' not in st.session_state or not st.session_state.processed_documents:
                         st.warning("⚠️ No processed tender documents found. Please process documents with Azure DI first.")
                         st.stop()
                     
                     # Use company profiles or fallback message
-                    company_data = company_profile_json if company_profile_json else "No company profiles provided for evaluation."
+                    company_data = st.session_state.company_profile_compact or "No company profiles provided for evaluation."
                     
-                    with st.spinner("🤖 Analyzing tender with Azure OpenAI reasoning model..."):
-                        # Call the reasoning model
-                        analysis_result = analyze_tender_with_reasoning_model(
-                            tender_content=all_tender_content,
-                            company_profiles=company_data,
-                            system_instructions=developer_message,
-                            model_name=model_selection,
-                            reasoning_effort=reasoning_effort,
-                            confidence_threshold=confidence_threshold
-                        )
+                    if batch_mode:
+                        with st.spinner("🤖 Analyzing tenders with the Azure OpenAI Batch API..."):
+                            batch_results = analyze_tenders_in_batch(
+                                tender_documents=st.session_state.processed_documents,
+                                company_profiles=company_data,
+                                system_instructions=developer_message,
+                                model_name=model_selection,
+                                reasoning_effort=reasoning_effort,
+                                confidence_threshold=confidence_threshold
+                            )
                         
-                        if analysis_result:
-                            st.success("✅ AI Analysis completed!")
+                        if batch_results:
+                            st.success(f"✅ Batch analysis completed for {len(batch_results)} tender(s)!")
                             
                             # Store results in session state for persistence
-                            st.session_state.ai_analysis_result = analysis_result
+                            st.session_state.ai_batch_results = batch_results
                             
-                            # Display results
-                            st.subheader("📊 AI Analysis Results")
+                            st.subheader("📊 AI Batch Analysis Results")
+                            for filename, batch_result in batch_results.items():
+                                with st.expander(f"📄 {filename}", expanded=True):
+                                    st.markdown(batch_result["content"])
+                                    st.download_button(
+                                        label="💾 Download Analysis Report",
+                                        data=batch_result["content"],
+                                        file_name=f"tender_analysis_{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+                                        mime="text/markdown",
+                                        key=f"batch_download_{filename}"
+                                    )
+                        else:
+                            st.error("❌ Failed to process with the Azure OpenAI Batch API. Please check your Azure OpenAI configuration.")
+                    else:
+                        # Collect all processed tender content
+                        tender_parts = []
+                        for filename, content in st.session_state.processed_documents.items():
+                            tender_parts.append(f"\n\n--- {filename} ---\n{content}")
+                        all_tender_content = "".join(tender_parts)
                             
-                            # Create tabs for different result views
-                            result_tab1, result_tab2, result_tab3 = st.tabs(["📝 Analysis Report", "📊 Model Metrics", "🔧 Technical Details"])
+                        with st.spinner("🤖 Analyzing tender with Azure OpenAI reasoning model..."):
+                            # Call the reasoning model
+                            analysis_result = analyze_tender_with_reasoning_model(
+                                tender_content=all_tender_content,
+                                company_profiles=company_data,
+                                system_instructions=developer_message,
+                                model_name=model_selection,
+                                reasoning_effort=reasoning_effort,
+                                confidence_threshold=confidence_threshold
+                            )
                             
-                            with result_tab1:
-                                st.markdown("**AI-Generated Analysis:**")
-                                st.markdown(analysis_result["content"])
+                            if analysis_result:
+                                st.success("✅ AI Analysis completed!")
                                 
-                                # Download button for the analysis
-                                st.download_button(
-                                    label="💾 Download Analysis Report",
-                                    data=analysis_result["content"],
-                                    file_name=f"tender_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
-                                    mime="text/markdown"
-                                )
-                            
-                            with result_tab2:
-                                st.markdown("**Processing Metrics:**")
-                                metric_col1, metric_col2, metric_col3 = st.columns(3)
+                                # Store results in session state for persistence
+                                st.session_state.ai_analysis_result = analysis_result
                                 
-                                with metric_col1:
-                                    st.metric("Processing Time", f"{analysis_result['processing_time']}s")
+                                # Display results
+                                st.subheader("📊 AI Analysis Results")
                                 
-                                with metric_col2:
-                                    st.metric("Documents Analyzed", len(st.session_state.processed_documents))
+                                # Create tabs for different result views
+                                result_tab1, result_tab2, result_tab3 = st.tabs(["📝 Analysis Report", "📊 Model Metrics", "🔧 Technical Details"])
                                 
-                                with metric_col3:
-                                    if analysis_result.get('reasoning_tokens', 0) > 0:
-                                        st.metric("Reasoning Tokens", f"{analysis_result['reasoning_tokens']:,}")
-                                    else:
-                                        st.metric("Model Used", analysis_result['model'])
+                                with result_tab1:
+                                    st.markdown("**AI-Generated Analysis:**")
+                                    st.markdown(analysis_result["content"])
+                                    
+                                    # Download button for the analysis
+                                    st.download_button(
+                                        label="💾 Download Analysis Report",
+                                        data=analysis_result["content"],
+                                        file_name=f"tender_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+                                        mime="text/markdown"
+                                    )
                                 
-                                # Token usage details if available
-                                if analysis_result.get('usage'):
-                                    st.markdown("**Token Usage:**")
-                                    usage_data = analysis_result['usage']
-                                    usage_col1, usage_col2, usage_col3 = st.columns(3)
+                                with result_tab2:
+                                    st.markdown("**Processing Metrics:**")
+                                    metric_col1, metric_col2, metric_col3 = st.columns(3)
                                     
-                                    with usage_col1:
-                                        if 'prompt_tokens' in usage_data:
-                                            st.metric("Prompt Tokens", f"{usage_data['prompt_tokens']:,}")
+                                    with metric_col1:
+                                        st.metric("Processing Time", f"{analysis_result['processing_time']}s")
                                     
-                                    with usage_col2:
-                                        if 'completion_tokens' in usage_data:
-                                            st.metric("Completion Tokens", f"{usage_data['completion_tokens']:,}")
+                                    with metric_col2:
+                                        st.metric("Documents Analyzed", len(st.session_state.processed_documents))
                                     
-                                    with usage_col3:
-                                        if 'total_tokens' in usage_data:
-                                            st.metric("Total Tokens", f"{usage_data['total_tokens']:,}")
-                            
-                            with result_tab3:
-                                st.markdown("**Configuration Used:**")
-                                config_info = {
-                                    "Model": analysis_result['model'],
-                                    "Reasoning Effort": reasoning_effort,
-                                    "Processing Time": f"{analysis_result['processing_time']} seconds",
-                                    "Documents Processed": list(st.session_state.processed_documents.keys()) if 'processed_documents' in st.session_state else []
-                                }
-                                st.json(config_info)
+                                    with metric_col3:
+                                        if analysis_result.get('reasoning_tokens', 0) > 0:
+                                            st.metric("Reasoning Tokens", f"{analysis_result['reasoning_tokens']:,}")
+                                        else:
+                                            st.metric("Model Used", analysis_result['model'])
+                                    
+                                    # Token usage details if available
+                                    if analysis_result.get('usage'):
+                                        st.markdown("**Token Usage:**")
+                                        usage_data = analysis_result['usage']
+                                        usage_col1, usage_col2, usage_col3 = st.columns(3)
+                                        
+                                        with usage_col1:
+                                            if 'prompt_tokens' in usage_data:
+                                                st.metric("Prompt Tokens", f"{usage_data['prompt_tokens']:,}")
+                                        
+                                        with usage_col2:
+                                            if 'completion_tokens' in usage_data:
+                                                st.metric("Completion Tokens", f"{usage_data['completion_tokens']:,}")
+                                        
+                                        with usage_col3:
+                                            if 'total_tokens' in usage_data:
+                                                st.metric("Total Tokens", f"{usage_data['total_tokens']:,}")
                                 
-                                # Raw response data
-                                with st.expander("🔍 Raw API Response", expanded=False):
-                                    st.json(analysis_result)
-                        else:
-                            st.error("❌ Failed to process with AI reasoning model. Please check your Azure OpenAI configuration.")
-                
+                                with result_tab3:
+                                    st.markdown("**Configuration Used:**")
+                                    config_info = {
+                                        "Model": analysis_result['model'],
+                                        "Reasoning Effort": reasoning_effort,
+                                        "Processing Time": f"{analysis_result['processing_time']} seconds",
+                                        "Documents Processed": list(st.session_state.processed_documents.keys()) if 'processed_documents' in st.session_state else []
+                                    }
+                                    st.json(config_info)
+                                    
+                                    # Raw response data
+                                    with st.expander("🔍 Raw API Response", expanded=False):
+                                        st.json(analysis_result)
+                            else:
+                                st.error("❌ Failed to process with AI reasoning model. Please check your Azure OpenAI configuration.")
+                    
                 elif not uploaded_files:
                     st.warning("⚠️ Please upload at least one document before processing.")
                 elif not company_profile_json:
@@ -452,8 +634,16 @@ Your output should include a matching score from 0% to 100% for each company, an
                 # Clear AI analysis results from session state
                 if 'ai_analysis_result' in st.session_state:
                     del st.session_state.ai_analysis_result
+                if 'ai_batch_results' in st.session_state:
+                    del st.session_state.ai_batch_results
+                # Clear cached Azure DI output
+                if 'di_cache' in st.session_state:
+                    del st.session_state.di_cache
                 # Clear company profile JSON input
                 st.session_state.company_profile_json = ""
+                st.session_state.company_profile_validated = ""
+                st.session_state.company_profile_valid = False
+                st.session_state.company_profile_compact = ""
                 st.rerun()
 
     # Info sidebar for this approach
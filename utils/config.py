@@ -1,11 +1,15 @@
 import os
 import dotenv
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from string import Formatter
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, Any, List, Optional, Tuple
 
-@dataclass
-class TenderSchema:
+class TenderSchema(BaseModel):
     """Schema for tender data"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     id: str
     title: str
     description: str
@@ -22,9 +26,10 @@ class TenderSchema:
     contact_info: Optional[Dict[str, str]] = None
     attachments: Optional[List[Dict[str, str]]] = None
 
-@dataclass
-class CompanySchema:
+class CompanySchema(BaseModel):
     """Schema for company data"""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     id: str
     name: str
     description: str
@@ -40,8 +45,9 @@ class CompanySchema:
     contact_info: Optional[Dict[str, str]] = None
 
 # Load environment variables
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
-    """Load configuration from .env file"""
+    """Load configuration from .env file (parsed once per process)"""
     dotenv.load_dotenv()
     
     config = {
@@ -57,6 +63,11 @@ def load_config() -> Dict[str, Any]:
         "AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME": os.getenv("AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME", "text-embedding-3-small"),
         "AZURE_OPENAI_API_VERSION": os.getenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview"),
         
+        # Ollama Configuration (local RecommenderLLM)
+        "OLLAMA_HOST": os.getenv("OLLAMA_HOST", "http://localhost:11434"),
+        "OLLAMA_MODEL": os.getenv("OLLAMA_MODEL", "llama3"),
+        "OLLAMA_EMBEDDING_MODEL": os.getenv("OLLAMA_EMBEDDING_MODEL", "nomic-embed-text"),
+        
         # Tender API Configuration
         "EU_TED_API_KEY": os.getenv("EU_TED_API_KEY", ""),
         "SWISS_TENDER_API_KEY": os.getenv("SWISS_TENDER_API_KEY", ""),
@@ -71,67 +82,46 @@ def load_config() -> Dict[str, Any]:
     
     return config
 
-# Prompt templates
-COMPANY_PROFILE_EXTRACTION_PROMPT = """
-You are a company profile analysis system. Please extract structured information from the following company document.
-
-Document Content:
-{document_text}
+def clear_config_cache() -> None:
+    """Drop the cached configuration so the next load_config() re-reads .env"""
+    load_config.cache_clear()
 
-Extract the following information:
-1. Company name
-2. Brief description of the company
-3. Industry sectors they operate in
-4. Services they offer
-5. Key expertise areas
-6. Company size/scale
-7. Notable past projects or clients
-8. Certifications or compliance standards
-9. Location information
-10. Any other relevant information for matching with tenders
+# Prompt templates live in utils/prompts/*.txt and are read on first use
+PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
 
-Format your response as a JSON object with the following structure:
-{{
-  "name": "Company Name",
-  "description": "Brief description of the company",
-  "industry": ["Industry1", "Industry2", ...],
-  "services": ["Service1", "Service2", ...],
-  "expertise": ["Expertise1", "Expertise2", ...],
-  "size": "Small/Medium/Large",
-  "past_projects": [
-    {{ "name": "Project Name", "description": "Brief description" }},
-    ...
-  ],
-  "certifications": ["Certification1", "Certification2", ...],
-  "location": "Company location",
-  "founded_year": 2005,
-  "additional_info": "Any other relevant information"
-}}
-"""
+# Legacy module attributes mapped to their prompt files
+_PROMPT_CONSTANTS = {
+    "COMPANY_PROFILE_EXTRACTION_PROMPT": "company_profile_extraction",
+    "TENDER_RECOMMENDATION_PROMPT": "tender_recommendation",
+}
 
-TENDER_RECOMMENDATION_PROMPT = """
-You are a tender recommendation system that matches companies with suitable tenders.
-Please analyze the following company profile and tender details to determine how well they match.
+@lru_cache(maxsize=None)
+def get_prompt(name: str) -> str:
+    """Load a prompt template from utils/prompts/<name>.txt (read once per process)"""
+    return (PROMPTS_DIR / f"{name}.txt").read_text(encoding="utf-8")
 
-Company Profile:
-{company_profile}
+def __getattr__(name: str) -> str:
+    """Resolve the legacy *_PROMPT constants lazily from their prompt files"""
+    if name in _PROMPT_CONSTANTS:
+        return get_prompt(_PROMPT_CONSTANTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-Tender Details:
-{tender_details}
+@lru_cache(maxsize=None)
+def _compile_prompt(name: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a str.format prompt template into (literal text, field name) pairs once"""
+    return tuple((literal, field_name) for literal, field_name, _, _ in Formatter().parse(get_prompt(name)))
 
-Please evaluate how well this tender matches the company's profile based on:
-1. Industry alignment
-2. Required expertise match
-3. Scale/size appropriateness
-4. Location compatibility
-5. Past experience relevance
-6. Certification/compliance match
+def _render_prompt(name: str, **fields: Any) -> str:
+    """Fill a compiled prompt template without re-scanning it for placeholders"""
+    return "".join(
+        literal if field_name is None else f"{literal}{fields[field_name]}"
+        for literal, field_name in _compile_prompt(name)
+    )
 
-Provide a match score between 0.0 (no match) and 1.0 (perfect match), along with your reasoning.
+def render_company_profile_extraction(document_text: str) -> str:
+    """Render the company profile extraction prompt"""
+    return _render_prompt("company_profile_extraction", document_text=document_text)
 
-Format your response as a JSON object with the following structure:
-{{
-  "match_score": 0.85,
-  "reasoning": "Detailed explanation of the match analysis including strengths and potential gaps"
-}}
-"""
\ No newline at end of file
+def render_tender_recommendation(company_profile: str, tender_details: str) -> str:
+    """Render the tender recommendation prompt"""
+    return _render_prompt("tender_recommendation", company_profile=company_profile, tender_details=tender_details)
@@ -0,0 +1,52 @@
+import json
+from datetime import date, datetime, time
+from typing import Any, Union
+
+# orjson is optional: it is several times faster than the stdlib json module,
+# but everything keeps working with plain json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception either way
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    # numpy arrays (e.g. embeddings) serialize without a .tolist() pass, and
+    # dicts keyed by ints/dates don't need converting first
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the types orjson handles natively when falling back to json"""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):
+        # numpy arrays and scalars
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON bytes
+
+    Args:
+        obj: Object to serialize; may contain datetimes and numpy arrays
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Deserialize a JSON document from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
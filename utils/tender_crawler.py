@@ -1,24 +1,167 @@
+import heapq
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Union
-from datetime import datetime, timedelta
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple, Union
+from datetime import date, datetime, timedelta
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from types import MappingProxyType
+from cachetools import TTLCache
+from pydantic import BaseModel, ValidationError
+
+from utils.serialization import json_dumps, json_loads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=64)
+def _date_range_strs(days_back: int, today_ordinal: int) -> Tuple[str, str]:
+    """Return (start, end) YYYY-MM-DD strings for a window ending on the given day"""
+    today = date.fromordinal(today_ordinal)
+    return (today - timedelta(days=days_back)).isoformat(), today.isoformat()
+
+# Parsed TED search results shared by all crawlers in the process, so repeated
+# searches within the TTL skip the HTTP round trip and parsing entirely
+TED_SEARCH_CACHE_TTL = 600
+_TED_SEARCH_CACHE = TTLCache(maxsize=1024, ttl=TED_SEARCH_CACHE_TTL)
+_TED_SEARCH_CACHE_LOCK = threading.Lock()
+
+# Languages tried in order when reading multilingual TED fields
+_LANG_PRIORITY = ("en", "fr", "de", "es", "it")
+
+# Mock EU tenders returned when the TED API is unavailable; deadline_days and
+# publication_date are turned into dates relative to the time of the call
+_MOCK_TENDERS = (
+    {
+        "id": "EU001-2025",
+        "title": "Renewable Energy Infrastructure Development",
+        "description": "Procurement for solar panel installation and wind energy systems across European municipalities",
+        "organization": "European Environment Agency",
+        "location": "EU",
+        "estimated_value": 5000000,
+        "currency": "EUR",
+        "deadline_days": 45,
+        "category": ["45112700", "31150000"],  # CPV codes
+        "source": "EU TED",
+        "source_url": "https://ted.europa.eu/udl?uri=TED:NOTICE:EU001-2025",
+        "cpv_codes": ["45112700", "31150000"],
+        "country_code": "EU"
+    },
+    {
+        "id": "EU002-2025",
+        "title": "Digital Infrastructure Modernization",
+        "description": "Technology procurement for digital transformation of government services",
+        "organization": "European Commission",
+        "location": "Brussels, Belgium",
+        "estimated_value": 12000000,
+        "currency": "EUR",
+        "deadline_days": 60,
+        "category": ["48000000", "72000000"],  # CPV codes
+        "source": "EU TED",
+        "source_url": "https://ted.europa.eu/udl?uri=TED:NOTICE:EU002-2025",
+        "cpv_codes": ["48000000", "72000000"],
+        "country_code": "BE"
+    },
+    {
+        "id": "EU003-2025",
+        "title": "Healthcare Equipment Procurement",
+        "description": "Medical devices and equipment for European healthcare facilities",
+        "organization": "European Health Insurance Card",
+        "location": "EU",
+        "estimated_value": 8500000,
+        "currency": "EUR",
+        "deadline_days": 30,
+        "category": ["33140000", "33100000"],  # CPV codes
+        "source": "EU TED",
+        "source_url": "https://ted.europa.eu/udl?uri=TED:NOTICE:EU003-2025",
+        "cpv_codes": ["33140000", "33100000"],
+        "country_code": "EU"
+    }
+)
+
+# Lower-cased title/description tokens per mock tender, built once at import
+_MOCK_INDEX = tuple(
+    (tender, frozenset(f"{tender['title']} {tender['description']}".lower().split()))
+    for tender in _MOCK_TENDERS
+)
+
+class TedSearchResponse(BaseModel):
+    """Expected shape of a TED notice search response"""
+    notices: List[Dict[str, Any]]
+
+class TenderAPIAuthError(Exception):
+    """Raised when a tender API rejects the configured credentials"""
+
 class TenderCrawlerBase(ABC):
     """Base class for tender crawlers"""
     
+    # Keep-alive connections held per host by the shared session
+    POOL_MAXSIZE = 20
+    
+    # Transient failures (429/5xx, connection errors) are retried by urllib3. Read
+    # timeouts are not, so a hung endpoint costs one READ_TIMEOUT rather than one per retry
+    MAX_RETRIES = 3
+    CONNECT_TIMEOUT = 5
+    READ_TIMEOUT = 30
+    BACKOFF_FACTOR = 0.5
+    BACKOFF_MAX = 20.0
+    # Random extra delay per retry so concurrent clients don't retry in lockstep
+    BACKOFF_JITTER = 1.0
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    
+    # Responses kept for ETag / Last-Modified revalidation
+    RESPONSE_CACHE_SIZE = 256
+    
+    # Statuses that mean the credentials are wrong on every endpoint, not just this one
+    AUTH_FAILURE_STATUS_CODES = (401, 403)
+    
     def __init__(self, api_key: str, base_url: str, name: str):
         self.api_key = api_key
         self.base_url = base_url
         self.name = name
+        # Read-only view so shared defaults can't be mutated after construction
+        self.headers = MappingProxyType(self._get_default_headers())
         self.session = requests.Session()
-        self.session.headers.update(self._get_default_headers())
+        self.session.headers.update(self.headers)
+        
+        # Size the connection pool so concurrent callers reuse sockets instead of reconnecting,
+        # and let urllib3 retry transient failures with jittered exponential backoff
+        retry = Retry(
+            total=self.MAX_RETRIES,
+            read=0,
+            backoff_factor=self.BACKOFF_FACTOR,
+            backoff_max=self.BACKOFF_MAX,
+            backoff_jitter=self.BACKOFF_JITTER,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET", "POST"}),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=self.POOL_MAXSIZE, pool_maxsize=self.POOL_MAXSIZE, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        # Conditional request validators and parsed bodies of cacheable GET responses
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     @abstractmethod
     def _get_default_headers(self) -> Dict[str, str]:
@@ -35,20 +178,104 @@ class TenderCrawlerBase(ABC):
         """Parse raw API response into standardized tender format"""
         pass
     
+    def search_tenders_many(self, queries: List[str], max_results: int = 10, **kwargs) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Run several searches concurrently over the shared session
+        
+        Args:
+            queries: Search keywords, one search per entry
+            max_results: Maximum number of results per query
+            **kwargs: Additional parameters passed to search_tenders
+            
+        Returns:
+            Mapping of each query to its list of tenders
+        """
+        if not queries:
+            return {}
+        
+        # Searches are I/O-bound, so a batch takes roughly as long as its slowest query
+        with ThreadPoolExecutor(max_workers=min(len(queries), self.POOL_MAXSIZE)) as executor:
+            futures = {
+                query: executor.submit(self.search_tenders, query=query, max_results=max_results, **kwargs)
+                for query in queries
+            }
+        
+        results = {}
+        for query, future in futures.items():
+            try:
+                results[query] = future.result()
+            except Exception as e:
+                logger.error(f"Error searching {self.name} for '{query}': {str(e)}")
+                results[query] = []
+        
+        return results
+    
+    def _get_cached_response(self, cache_key: bytes) -> Optional[Tuple[Dict[str, str], Any]]:
+        """Return (conditional headers, parsed body) for a cached GET response"""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(cache_key)
+            if entry is not None:
+                self._response_cache.move_to_end(cache_key)
+            return entry
+    
+    def _store_cached_response(self, cache_key: bytes, response: requests.Response, data: Any) -> None:
+        """Remember a GET response that carries ETag / Last-Modified validators"""
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        if not validators:
+            return
+        
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = (validators, data)
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
     def _make_request(self, endpoint: str, params: Dict[str, Any] = None, method: str = "GET") -> Optional[Dict[str, Any]]:
-        """Make HTTP request to the API"""
+        """
+        Make HTTP request to the API
+        
+        Args:
+            endpoint: Path appended to the base URL
+            params: Query parameters (GET) or JSON body (POST)
+            method: HTTP method, GET or POST
+            
+        Returns:
+            Parsed JSON response, or None if the request failed
+            
+        Raises:
+            TenderAPIAuthError: If the API rejects the credentials
+        """
         url = f"{self.base_url}{endpoint}"
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        if method == "GET":
+            cache_key = hashlib.blake2b(json_dumps([url, params]), digest_size=16).digest()
         
         try:
-            if method.upper() == "GET":
-                response = self.session.get(url, params=params, timeout=30)
-            elif method.upper() == "POST":
-                response = self.session.post(url, json=params, timeout=30)
+            if method == "GET":
+                # Revalidate a previously seen response instead of downloading it again
+                cached = self._get_cached_response(cache_key)
+                response = self.session.get(url, params=params, headers=cached[0] if cached else None, timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT))
+                if response.status_code == 304 and cached:
+                    return cached[1]
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+                # Content-Type is already set in the session's default headers
+                response = self.session.post(url, data=json_dumps(params) if params is not None else None, timeout=(self.CONNECT_TIMEOUT, self.READ_TIMEOUT))
+            
+            if response.status_code in self.AUTH_FAILURE_STATUS_CODES:
+                raise TenderAPIAuthError(f"{self.name} rejected the API key (HTTP {response.status_code})")
             
             response.raise_for_status()
-            return response.json()
+            data = json_loads(response.content)
+            if method == "GET":
+                self._store_cached_response(cache_key, response, data)
+            return data
             
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed for {self.name}: {str(e)}")
@@ -60,12 +287,27 @@ class TenderCrawlerBase(ABC):
 class EUTenderCrawler(TenderCrawlerBase):
     """Crawler for EU TED (Tenders Electronic Daily) API"""
     
-    def __init__(self, api_key: str):
+    # Search endpoints tried in order until one responds
+    SEARCH_ENDPOINTS = (
+        "/v3.0/notices/search",
+        "/api/v2.0/notices/search",
+        "/notices/search"
+    )
+    
+    def __init__(self, api_key: str, include_raw: bool = False):
+        """
+        Initialize the TED crawler
+        
+        Args:
+            api_key: TED API key
+            include_raw: Keep the original notice under "raw_data" in parsed tenders
+        """
         super().__init__(
             api_key=api_key,
             base_url="https://api.ted.europa.eu",  # Updated base URL
             name="EU TED"
         )
+        self.include_raw = include_raw
     
     def _get_default_headers(self) -> Dict[str, str]:
         """Get default headers for TED API requests"""
@@ -100,10 +342,20 @@ class EUTenderCrawler(TenderCrawlerBase):
         logger.info(f"Searching EU TED for: {query} (max {max_results} results)")
         
         # Set default date range if not provided
-        if not publication_date_from:
-            publication_date_from = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
-        if not publication_date_to:
-            publication_date_to = datetime.now().strftime("%Y-%m-%d")
+        if not publication_date_from or not publication_date_to:
+            default_from, default_to = _date_range_strs(30, date.today().toordinal())
+            publication_date_from = publication_date_from or default_from
+            publication_date_to = publication_date_to or default_to
+        
+        cache_key = hashlib.blake2b(json_dumps([
+            query, country_codes, cpv_codes, publication_date_from, publication_date_to,
+            max_results, self.include_raw
+        ]), digest_size=16).digest()
+        with _TED_SEARCH_CACHE_LOCK:
+            cached_tenders = _TED_SEARCH_CACHE.get(cache_key)
+        if cached_tenders is not None:
+            logger.info(f"Returning {len(cached_tenders)} cached EU TED tenders")
+            return list(cached_tenders)
         
         # Build search parameters
         params = {
@@ -125,28 +377,15 @@ class EUTenderCrawler(TenderCrawlerBase):
         
         try:
             # Try the real API first - multiple possible endpoints
-            endpoints_to_try = [
-                "/v3.0/notices/search",
-                "/api/v2.0/notices/search", 
-                "/notices/search"
-            ]
+            # Responses are validated in the probe so API drift fails loudly there
+            search_response = self._probe_search_endpoints(params)
             
-            response = None
-            for endpoint in endpoints_to_try:
-                response = self._make_request(endpoint, params)
-                if response:
-                    break
-                    
-            if not response:
+            if search_response is None:
                 logger.warning("All EU TED API endpoints failed, using fallback data")
                 return self._get_fallback_tenders(query, max_results)
             
-            if "notices" not in response:
-                logger.warning("No notices field in TED API response, using fallback data")
-                return self._get_fallback_tenders(query, max_results)
-            
             tenders = []
-            for notice in response["notices"][:max_results]:
+            for notice in search_response.notices[:max_results]:
                 try:
                     parsed_tender = self._parse_tender_data(notice)
                     if parsed_tender:
@@ -156,12 +395,79 @@ class EUTenderCrawler(TenderCrawlerBase):
                     continue
             
             logger.info(f"Successfully retrieved {len(tenders)} tenders from EU TED")
-            return tenders
+            
+            # Only real API results are cached, so the API is retried once it recovers
+            with _TED_SEARCH_CACHE_LOCK:
+                _TED_SEARCH_CACHE[cache_key] = tenders
+            return list(tenders)
+            
+        except TenderAPIAuthError as e:
+            logger.error(f"{str(e)}, using fallback data")
+            return self._get_fallback_tenders(query, max_results)
             
         except Exception as e:
             logger.error(f"Error searching EU TED: {str(e)}")
             return self._get_fallback_tenders(query, max_results)
     
+    def _probe_search_endpoints(self, params: Dict[str, Any]) -> Optional[TedSearchResponse]:
+        """
+        Query all search endpoints concurrently and return the best valid response
+        
+        An outage now costs one request timeout instead of one per endpoint. Endpoints
+        keep the priority of SEARCH_ENDPOINTS: a response is only returned once every
+        higher-priority endpoint has failed, so the result doesn't depend on timing.
+        
+        Args:
+            params: Search parameters
+            
+        Returns:
+            Validated response from the highest-priority endpoint that answered with
+            notices, or None if all failed
+            
+        Raises:
+            TenderAPIAuthError: When an endpoint rejects the API key and no higher-priority
+                endpoint can still return a valid response
+        """
+        executor = ThreadPoolExecutor(max_workers=len(self.SEARCH_ENDPOINTS))
+        try:
+            futures = {
+                executor.submit(self._make_request, endpoint, params): priority
+                for priority, endpoint in enumerate(self.SEARCH_ENDPOINTS)
+            }
+            # Each endpoint's outcome: a validated response, an auth error or None
+            results: List[Union[TedSearchResponse, TenderAPIAuthError, None]] = [None] * len(futures)
+            pending = set(range(len(futures)))
+            for future in as_completed(futures):
+                priority = futures[future]
+                pending.discard(priority)
+                try:
+                    results[priority] = self._validate_search_response(self.SEARCH_ENDPOINTS[priority], future.result())
+                except TenderAPIAuthError as e:
+                    results[priority] = e
+                
+                # Settle on the first outcome that no higher-priority endpoint can still beat
+                for candidate in range(len(results)):
+                    if candidate in pending:
+                        break
+                    if isinstance(results[candidate], TenderAPIAuthError):
+                        raise results[candidate]
+                    if results[candidate] is not None:
+                        return results[candidate]
+            return None
+        finally:
+            # Don't block on slower endpoints once one has answered or auth failed
+            executor.shutdown(wait=False)
+    
+    def _validate_search_response(self, endpoint: str, response: Optional[Dict[str, Any]]) -> Optional[TedSearchResponse]:
+        """Check a raw search response has the expected shape, returning None if not"""
+        if not response:
+            return None
+        try:
+            return TedSearchResponse.model_validate(response)
+        except ValidationError as e:
+            logger.warning(f"Unexpected TED API response from {endpoint} ({e.error_count()} validation errors)")
+            return None
+    
     def _parse_tender_data(self, notice: Dict[str, Any]) -> Dict[str, Any]:
         """Parse TED API notice into standardized tender format"""
         try:
@@ -209,7 +515,7 @@ class EUTenderCrawler(TenderCrawlerBase):
             # Build source URL
             source_url = f"https://ted.europa.eu/udl?uri=TED:NOTICE:{tender_id}"
             
-            return {
+            tender = {
                 "id": tender_id,
                 "title": title,
                 "description": description,
@@ -223,10 +529,16 @@ class EUTenderCrawler(TenderCrawlerBase):
                 "source_url": source_url,
                 "publication_date": notice.get("publicationDate"),
                 "cpv_codes": categories,
-                "country_code": notice.get("countryCode"),
-                "raw_data": notice  # Keep original data for debugging
+                "country_code": notice.get("countryCode")
             }
             
+            # The full notice is large and ends up serialized with every tender,
+            # so it is only kept when asked for (e.g. for debugging)
+            if self.include_raw:
+                tender["raw_data"] = notice
+            
+            return tender
+            
         except Exception as e:
             logger.error(f"Error parsing tender notice: {str(e)}")
             return None
@@ -236,87 +548,37 @@ class EUTenderCrawler(TenderCrawlerBase):
         if isinstance(text_obj, str):
             return text_obj
         
-        if isinstance(text_obj, dict):
-            # Try English first
-            if "en" in text_obj:
-                return text_obj["en"]
-            
-            # Try other common languages
-            for lang in ["fr", "de", "es", "it"]:
-                if lang in text_obj:
-                    return text_obj[lang]
-            
-            # Return first available value
-            if text_obj:
-                return list(text_obj.values())[0]
+        if not isinstance(text_obj, dict) or not text_obj:
+            return ""
         
-        return ""
+        # English first, then other common languages
+        for lang in _LANG_PRIORITY:
+            text = text_obj.get(lang)
+            if text:
+                return text
+        
+        # Return first available value
+        return next(iter(text_obj.values()), "")
     
     def _get_fallback_tenders(self, query: str, max_results: int) -> List[Dict[str, Any]]:
         """Return mock data when API fails"""
         logger.info("Using fallback mock data for EU tenders")
         
-        mock_tenders = [
-            {
-                "id": "EU001-2025",
-                "title": "Renewable Energy Infrastructure Development",
-                "description": "Procurement for solar panel installation and wind energy systems across European municipalities",
-                "organization": "European Environment Agency",
-                "location": "EU",
-                "estimated_value": 5000000,
-                "currency": "EUR",
-                "deadline": (datetime.now() + timedelta(days=45)).isoformat(),
-                "category": ["45112700", "31150000"],  # CPV codes
-                "source": "EU TED",
-                "source_url": "https://ted.europa.eu/udl?uri=TED:NOTICE:EU001-2025",
-                "publication_date": datetime.now().isoformat(),
-                "cpv_codes": ["45112700", "31150000"],
-                "country_code": "EU"
-            },
-            {
-                "id": "EU002-2025",
-                "title": "Digital Infrastructure Modernization",
-                "description": "Technology procurement for digital transformation of government services",
-                "organization": "European Commission",
-                "location": "Brussels, Belgium",
-                "estimated_value": 12000000,
-                "currency": "EUR",
-                "deadline": (datetime.now() + timedelta(days=60)).isoformat(),
-                "category": ["48000000", "72000000"],  # CPV codes
-                "source": "EU TED",
-                "source_url": "https://ted.europa.eu/udl?uri=TED:NOTICE:EU002-2025",
-                "publication_date": datetime.now().isoformat(),
-                "cpv_codes": ["48000000", "72000000"],
-                "country_code": "BE"
-            },
-            {
-                "id": "EU003-2025",
-                "title": "Healthcare Equipment Procurement",
-                "description": "Medical devices and equipment for European healthcare facilities",
-                "organization": "European Health Insurance Card",
-                "location": "EU",
-                "estimated_value": 8500000,
-                "currency": "EUR",
-                "deadline": (datetime.now() + timedelta(days=30)).isoformat(),
-                "category": ["33140000", "33100000"],  # CPV codes
-                "source": "EU TED",
-                "source_url": "https://ted.europa.eu/udl?uri=TED:NOTICE:EU003-2025",
-                "publication_date": datetime.now().isoformat(),
-                "cpv_codes": ["33140000", "33100000"],
-                "country_code": "EU"
-            }
-        ]
+        query_tokens = set(query.lower().split())
+        now = datetime.now()
         
-        # Filter based on query keywords
+        # Token-set intersection per tender instead of substring scans over the text
         filtered_tenders = []
-        query_lower = query.lower()
-        
-        for tender in mock_tenders:
-            title_desc = (tender["title"] + " " + tender["description"]).lower()
-            if any(keyword in title_desc for keyword in query_lower.split()):
+        for mock_tender, tokens in _MOCK_INDEX:
+            if len(filtered_tenders) >= max_results:
+                break
+            if tokens & query_tokens:
+                tender = dict(mock_tender)
+                tender["deadline"] = (now + timedelta(days=tender.pop("deadline_days"))).isoformat()
+                tender["publication_date"] = now.isoformat()
                 filtered_tenders.append(tender)
         
-        return filtered_tenders[:max_results]
+        return filtered_tenders
 
 class SwissTenderCrawler(TenderCrawlerBase):
     """Placeholder for Swiss tender crawler - to be implemented later"""
@@ -426,24 +688,36 @@ class TenderAPIWrapper:
             sources = list(self.crawlers.keys())
         
         all_tenders = []
-        results_per_source = max(1, max_results // len(sources))
         
-        for source in sources:
-            if source in self.crawlers:
-                try:
-                    tenders = self.crawlers[source].search_tenders(
-                        query=query,
-                        max_results=results_per_source,
-                        **kwargs
-                    )
-                    all_tenders.extend(tenders)
-                except Exception as e:
-                    logger.error(f"Error searching {source}: {str(e)}")
+        active_sources = [source for source in sources if source in self.crawlers]
+        if not active_sources:
+            return []
         
-        # Sort by publication date (newest first) and limit results
-        all_tenders.sort(
-            key=lambda x: x.get("publication_date", ""), 
-            reverse=True
-        )
+        # Searches are I/O-bound, so run them in parallel; total latency is the slowest source.
+        # Ask every source for the full amount and truncate the merged list, so one
+        # source returning fewer tenders doesn't leave the combined result short
+        with ThreadPoolExecutor(max_workers=len(active_sources)) as executor:
+            futures = {
+                source: executor.submit(
+                    self.crawlers[source].search_tenders,
+                    query=query,
+                    max_results=max_results,
+                    **kwargs
+                )
+                for source in active_sources
+            }
         
-        return all_tenders[:max_results]
+        # Collect in source order so ties in the date sort stay deterministic
+        for source, future in futures.items():
+            try:
+                all_tenders.extend(future.result())
+            except Exception as e:
+                logger.error(f"Error searching {source}: {str(e)}")
+        
+        # Keep the newest max_results by publication date; nlargest is O(N log k) instead of a
+        # full sort and, like sorted(..., reverse=True)[:k], keeps ties in source order
+        return heapq.nlargest(
+            max_results,
+            all_tenders,
+            key=lambda x: x.get("publication_date") or ""
+        )
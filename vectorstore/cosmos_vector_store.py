@@ -1,26 +1,321 @@
 import os
 import json
 import uuid
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Any, Iterator, Optional, Tuple
+from itertools import islice
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from azure.cosmos import CosmosClient, PartitionKey
 from azure.cosmos.exceptions import CosmosResourceNotFoundError
-from openai import AzureOpenAI
+from openai import AzureOpenAI, AsyncAzureOpenAI
 import numpy as np
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Embeddings are stored as unit-length float32 vectors; Cosmos keeps them in its binary
+# vector format, and on unit vectors cosine similarity is just the dot product
+EMBEDDING_DIMENSIONS = 1536  # text-embedding-3-small dimension
+
+# Containers are partitioned on the document type ("tender" / "company")
+PARTITION_KEY_PATH = "/type"
+
+# Fallback used when embeddings can't be generated; a tuple so the one instance can be
+# handed out everywhere without being mutated
+_ZERO_EMBEDDING = (0.0,) * EMBEDDING_DIMENSIONS
+_VECTOR_EMBEDDING_POLICY = {
+    "vectorEmbeddings": [
+        {
+            "path": "/embedding",
+            "dataType": "float32",
+            "distanceFunction": "dotproduct",
+            "dimensions": EMBEDDING_DIMENSIONS
+        }
+    ]
+}
+
+def _indexing_policy(vector_index_type: str) -> Dict[str, Any]:
+    """
+    Indexing policy with a vector index on /embedding
+    
+    The embedding, its source text and the raw record are never filtered on, so they
+    are kept out of the regular index to make writes cheaper.
+    """
+    return {
+        "indexingMode": "consistent",
+        "automatic": True,
+        "includedPaths": [{"path": "/*"}],
+        "excludedPaths": [
+            {"path": "/\"_etag\"/?"},
+            {"path": "/embedding/*"},
+            {"path": "/embedding_text/?"},
+            {"path": "/data/*"}
+        ],
+        "vectorIndexes": [{"path": "/embedding", "type": vector_index_type}]
+    }
+
+# Tenders keep growing, so they get a DiskANN graph index; the company set stays small,
+# where a quantized flat scan is exact enough and cheaper to maintain
+_TENDER_INDEXING_POLICY = _indexing_policy("diskANN")
+_COMPANY_INDEXING_POLICY = _indexing_policy("quantizedFlat")
+
+def _to_float32_list(embedding: List[float]) -> List[float]:
+    """
+    L2-normalize an embedding and round it to float32 precision with short decimals
+    
+    Normalizing at write and query time lets the container use dot product instead of
+    cosine distance. Rounding the unit-length components to 8 decimal places keeps what
+    float32 can represent while printing far fewer digits than the ~17 of float64,
+    roughly halving the JSON bytes written and read per embedding.
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    # The epsilon keeps the zero-vector fallback at zero instead of NaN
+    vector = vector / (np.linalg.norm(vector) + 1e-12)
+    # Vectorized rounding; a per-element str/float round trip costs milliseconds per vector
+    return np.round(vector.astype(np.float64), 8).tolist()
+
+def _provided_embedding(data: Dict[str, Any]) -> Optional[List[float]]:
+    """
+    Return the embedding already carried by a document, if it has the expected size
+    
+    Lets migrations and backfills that already hold vectors skip the embeddings API.
+    """
+    embedding = data.get('embedding')
+    if embedding is not None and len(embedding) == EMBEDDING_DIMENSIONS:
+        return embedding
+    return None
+
+def _without_embedding(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a document's data without a caller-supplied embedding, which is stored separately"""
+    if 'embedding' not in data:
+        return data
+    return {key: value for key, value in data.items() if key != 'embedding'}
+
+# Clients shared by every store in the process, keyed by (endpoint, key), so stores on
+# different databases of one account still share its connection pool
+_CLIENT_CACHE: Dict[Tuple[str, str], CosmosClient] = {}
+
+# Client, database and container handles shared by every store in the process,
+# keyed by (endpoint, key, database name)
+_HANDLE_CACHE: Dict[Tuple[str, str, str], Tuple[Any, Any, Any, Any]] = {}
+_HANDLE_CACHE_LOCK = threading.Lock()
+
+# The Cosmos SDK is synchronous, so the async methods run its calls on this pool; the
+# cap bounds outbound concurrency to what the connection pool and RU budget can take
+IO_POOL_MAX_WORKERS = 10
+_IO_POOL = ThreadPoolExecutor(max_workers=IO_POOL_MAX_WORKERS, thread_name_prefix="cosmos-io")
+
+def _get_cosmos_client(cosmos_endpoint: str, cosmos_key: str) -> CosmosClient:
+    """Return the shared client for an account; callers hold _HANDLE_CACHE_LOCK"""
+    client_key = (cosmos_endpoint, cosmos_key)
+    cosmos_client = _CLIENT_CACHE.get(client_key)
+    if cosmos_client is None:
+        # Session consistency gives read-your-writes per client at a lower RU cost
+        # than strong or bounded staleness
+        cosmos_client = CosmosClient(cosmos_endpoint, cosmos_key, consistency_level="Session")
+        _CLIENT_CACHE[client_key] = cosmos_client
+    return cosmos_client
+
+def _check_partition_key(container_properties: Dict[str, Any]) -> None:
+    """
+    Fail loudly when an existing container isn't partitioned on PARTITION_KEY_PATH
+    
+    create_container_if_not_exists returns an existing container unchanged, and every
+    query and point read here targets a /type partition, so a container partitioned on
+    anything else would silently return no results.
+    """
+    paths = container_properties.get("partitionKey", {}).get("paths", [])
+    if paths != [PARTITION_KEY_PATH]:
+        raise ValueError(
+            f"Cosmos DB container '{container_properties.get('id')}' is partitioned on {paths}, "
+            f"expected ['{PARTITION_KEY_PATH}']; recreate it and re-ingest its documents"
+        )
+
+def _get_cosmos_handles(cosmos_endpoint: str, cosmos_key: str, database_name: str) -> Tuple[Any, Any, Any, Any]:
+    """
+    Return (client, database, tenders container, companies container), creating them once
+    
+    The create_*_if_not_exists calls are service round trips, so they only run the
+    first time a database is opened in this process.
+    """
+    cache_key = (cosmos_endpoint, cosmos_key, database_name)
+    with _HANDLE_CACHE_LOCK:
+        handles = _HANDLE_CACHE.get(cache_key)
+        if handles is None:
+            cosmos_client = _get_cosmos_client(cosmos_endpoint, cosmos_key)
+            
+            # Initialize database and containers
+            database = cosmos_client.create_database_if_not_exists(id=database_name)
+            
+            # Create containers with vector indexing. Partitioning by /type keeps every
+            # document of a container in one logical partition, so searches and listings
+            # are single-partition queries instead of fanning out across all partitions
+            tenders_container, tenders_properties = database.create_container_if_not_exists(
+                id="tenders",
+                partition_key=PartitionKey(path=PARTITION_KEY_PATH),
+                offer_throughput=400,
+                indexing_policy=_TENDER_INDEXING_POLICY,
+                vector_embedding_policy=_VECTOR_EMBEDDING_POLICY,
+                return_properties=True
+            )
+            _check_partition_key(tenders_properties)
+            
+            companies_container, companies_properties = database.create_container_if_not_exists(
+                id="companies", 
+                partition_key=PartitionKey(path=PARTITION_KEY_PATH),
+                offer_throughput=400,
+                indexing_policy=_COMPANY_INDEXING_POLICY,
+                vector_embedding_policy=_VECTOR_EMBEDDING_POLICY,
+                return_properties=True
+            )
+            _check_partition_key(companies_properties)
+            
+            handles = (cosmos_client, database, tenders_container, companies_container)
+            _HANDLE_CACHE[cache_key] = handles
+        
+        return handles
+
+def clear_handle_cache() -> None:
+    """Drop the shared Cosmos DB clients and handles so the next store reconnects"""
+    with _HANDLE_CACHE_LOCK:
+        _HANDLE_CACHE.clear()
+        _CLIENT_CACHE.clear()
+
+def _vector_search_sql(fields: List[str]) -> str:
+    """Build the vector search SQL selecting the given document fields"""
+    return f"""
+    SELECT 
+        {", ".join(fields)},
+        VectorDistance(c.embedding, @queryVector) AS similarity_score
+    FROM c 
+    ORDER BY VectorDistance(c.embedding, @queryVector)
+    OFFSET 0 LIMIT @limit
+    """
+
+# Vector search SQL keyed by projection. The text is fixed and only the parameters
+# change between calls, so the SDK's query plan cache sees the same query every time.
+# "ids" returns just id and score for ranking, "summary" adds the denormalised
+# fields and "full" also reads the whole record under c.data
+_TENDER_SEARCH_SQL = {
+    "ids": _vector_search_sql(["c.id"]),
+    "summary": _vector_search_sql(["c.id", "c.metadata", "c.title", "c.category", "c.location", "c.estimated_value"]),
+    "full": _vector_search_sql(["c.id", "c.data", "c.metadata", "c.title", "c.category", "c.location", "c.estimated_value"])
+}
+_COMPANY_SEARCH_SQL = {
+    "ids": _vector_search_sql(["c.id"]),
+    "summary": _vector_search_sql(["c.id", "c.metadata", "c.name", "c.industry", "c.services", "c.location", "c.size"]),
+    "full": _vector_search_sql(["c.id", "c.data", "c.metadata", "c.name", "c.industry", "c.services", "c.location", "c.size"])
+}
+
+def _search_projection(include_full: bool, ids_only: bool) -> str:
+    """Pick the search SQL projection for the given flags; ids_only wins"""
+    if ids_only:
+        return "ids"
+    return "full" if include_full else "summary"
+
+# Listing SQL, newest first. Only the listed fields are projected; the embedding is by
+# far the largest part of a document
+_TENDER_LIST_SQL = """
+SELECT 
+    c.id,
+    c.type,
+    c.data,
+    c.metadata,
+    c.created_at,
+    c.title,
+    c.category,
+    c.location,
+    c.estimated_value,
+    c._ts
+FROM c 
+ORDER BY c._ts DESC
+"""
+_COMPANY_LIST_SQL = """
+SELECT 
+    c.id,
+    c.type,
+    c.data,
+    c.metadata,
+    c.name,
+    c.industry,
+    c.services,
+    c.location,
+    c.size,
+    c._ts
+FROM c 
+ORDER BY c._ts DESC
+"""
+
+# (field, label, is_list) in the order they appear in the embedding text
+_TENDER_TEXT_FIELDS = (
+    ('title', 'Title', False),
+    ('description', 'Description', False),
+    ('category', 'Categories', True),
+    ('organization', 'Organization', False),
+    ('location', 'Location', False),
+    ('estimated_value', 'Estimated Value', False)
+)
+_COMPANY_TEXT_FIELDS = (
+    ('name', 'Company', False),
+    ('description', 'Description', False),
+    ('industry', 'Industries', True),
+    ('services', 'Services', True),
+    ('expertise', 'Expertise', True),
+    ('location', 'Location', False),
+    ('size', 'Size', False)
+)
+
+def _build_embedding_text(data: Dict[str, Any], fields: Tuple[Tuple[str, str, bool], ...]) -> str:
+    """Join the non-empty fields of a document as 'Label: value' parts"""
+    return " | ".join(
+        f"{label}: {', '.join(value) if is_list and isinstance(value, list) else value}"
+        for key, label, is_list in fields
+        if (value := data.get(key))
+    )
+
 class CosmosDBVectorStore:
     """Vector store implementation using Azure Cosmos DB with vector search capabilities"""
     
+    # Vector searches in flight at once for the batch search methods
+    SEARCH_MAX_WORKERS = 8
+    
+    # Concurrent point reads when fetching several documents by ID
+    READ_MAX_CONCURRENCY = 10
+    
+    # Texts sent per embeddings request (older Azure deployments accept at most 16)
+    EMBEDDING_BATCH_SIZE = 16
+    
+    # Embedding requests in flight at once on the async ingest path
+    EMBEDDING_MAX_CONCURRENCY = 4
+    
+    # Documents per transactional batch write; the service allows 100 operations and 2 MB,
+    # and at ~16 KB of embedding per document 50 stays well under the size limit
+    WRITE_BATCH_SIZE = 50
+    
+    # Consecutive embedding failures after which the API is skipped for a cooldown
+    EMBEDDING_FAILURE_THRESHOLD = 5
+    EMBEDDING_COOLDOWN_SECONDS = 30
+    
+    # Embeddings kept in memory, keyed by deployment and text digest
+    EMBEDDING_CACHE_SIZE = 10_000
+    
     def __init__(self, 
                  cosmos_endpoint: str,
                  cosmos_key: str,
                  database_name: str,
                  openai_client: AzureOpenAI,
-                 embedding_deployment: str):
+                 embedding_deployment: str,
+                 async_openai_client: Optional[AsyncAzureOpenAI] = None,
+                 embedding_cache_path: Optional[str] = None,
+                 store_embedding_text: bool = False):
         """
         Initialize the Cosmos DB vector store
         
@@ -30,42 +325,250 @@ class CosmosDBVectorStore:
             database_name: Name of the database
             openai_client: Azure OpenAI client for embeddings
             embedding_deployment: Name of the embedding deployment
+            async_openai_client: Async Azure OpenAI client used by the async bulk methods
+            embedding_cache_path: SQLite file that keeps embeddings across restarts (disabled if None)
+            store_embedding_text: Keep the text each embedding was computed from on the document
         """
-        self.cosmos_client = CosmosClient(cosmos_endpoint, cosmos_key)
         self.database_name = database_name
         self.openai_client = openai_client
+        self.async_openai_client = async_openai_client
         self.embedding_deployment = embedding_deployment
+        self.store_embedding_text = store_embedding_text
         
-        # Initialize database and containers
-        self.database = self.cosmos_client.create_database_if_not_exists(id=database_name)
+        # Reuse the process-wide client and container handles for this database
+        (self.cosmos_client,
+         self.database,
+         self.tenders_container,
+         self.companies_container) = _get_cosmos_handles(cosmos_endpoint, cosmos_key, database_name)
         
-        # Create containers with vector indexing
-        self.tenders_container = self.database.create_container_if_not_exists(
-            id="tenders",
-            partition_key=PartitionKey(path="/id"),
-            offer_throughput=400
-        )
+        # LRU cache of embeddings so repeated queries and documents skip the API call
+        self._embedding_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
         
-        self.companies_container = self.database.create_container_if_not_exists(
-            id="companies", 
-            partition_key=PartitionKey(path="/id"),
-            offer_throughput=400
-        )
+        # Optional on-disk layer behind the LRU, so restarts don't re-embed known texts
+        self._embedding_db = self._open_embedding_db(embedding_cache_path) if embedding_cache_path else None
+        self._embedding_db_lock = threading.Lock()
+        
+        # Circuit breaker state for the embeddings API
+        self._embedding_failures = 0
+        self._embedding_circuit_open_until = 0.0
         
         logger.info(f"Successfully initialized Cosmos DB vector store with database: {database_name}")
     
     def _generate_embedding(self, text: str) -> List[float]:
         """Generate embeddings using Azure OpenAI"""
-        try:
-            response = self.openai_client.embeddings.create(
-                input=text,
-                model=self.embedding_deployment
+        return self._generate_embeddings([text])[0]
+    
+    def _generate_embeddings(self, texts: List[str], allow_fallback: bool = True) -> List[Optional[List[float]]]:
+        """
+        Generate embeddings for several texts, EMBEDDING_BATCH_SIZE texts per request
+        
+        Args:
+            texts: Texts to embed
+            allow_fallback: Use a zero vector for texts that can't be embedded; when
+                False they get None instead, so ingest can skip them
+            
+        Returns:
+            One embedding per input text, in input order
+        """
+        fallback = _ZERO_EMBEDDING if allow_fallback else None
+        keys, embeddings, missing = self._split_cached_embeddings(texts)
+        
+        missing_keys = list(missing)
+        missing_texts = list(missing.values())
+        for start in range(0, len(missing_texts), self.EMBEDDING_BATCH_SIZE):
+            batch_keys = missing_keys[start:start + self.EMBEDDING_BATCH_SIZE]
+            if self._embedding_circuit_open():
+                # Fallbacks are never cached
+                batch_embeddings = [fallback] * len(batch_keys)
+            else:
+                try:
+                    batch_embeddings = self._generate_embeddings_batch(missing_texts[start:start + self.EMBEDDING_BATCH_SIZE])
+                except Exception as e:
+                    logger.error(f"Error generating embeddings: {str(e)}")
+                    self._record_embedding_failure()
+                    batch_embeddings = [fallback] * len(batch_keys)
+                else:
+                    self._embedding_failures = 0
+                    self._store_cached_embeddings(zip(batch_keys, batch_embeddings))
+            embeddings.update(zip(batch_keys, batch_embeddings))
+        
+        return [embeddings[key] for key in keys]
+    
+    def _generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for one batch of texts with a single Azure OpenAI request"""
+        response = self.openai_client.embeddings.create(
+            input=texts,
+            model=self.embedding_deployment
+        )
+        # The API tags every embedding with the position of its input
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+    
+    async def _agenerate_embeddings(self, texts: List[str], allow_fallback: bool = True) -> List[Optional[List[float]]]:
+        """
+        Async variant of _generate_embeddings that sends the batches concurrently
+        
+        At most EMBEDDING_MAX_CONCURRENCY requests are in flight at once.
+        
+        Args:
+            texts: Texts to embed
+            allow_fallback: Use a zero vector for texts that can't be embedded, else None
+            
+        Returns:
+            One embedding per input text, in input order
+        """
+        if self.async_openai_client is None:
+            # No async client configured; run the sync path on the I/O pool
+            return await self._run_io(self._generate_embeddings, texts, allow_fallback)
+        
+        fallback = _ZERO_EMBEDDING if allow_fallback else None
+        keys, embeddings, missing = self._split_cached_embeddings(texts)
+        
+        missing_keys = list(missing)
+        missing_texts = list(missing.values())
+        semaphore = asyncio.Semaphore(self.EMBEDDING_MAX_CONCURRENCY)
+        
+        async def embed_batch(start: int):
+            batch_keys = missing_keys[start:start + self.EMBEDDING_BATCH_SIZE]
+            async with semaphore:
+                if self._embedding_circuit_open():
+                    # Fallbacks are never cached
+                    return batch_keys, [fallback] * len(batch_keys)
+                try:
+                    batch_embeddings = await self._agenerate_embeddings_batch(missing_texts[start:start + self.EMBEDDING_BATCH_SIZE])
+                except Exception as e:
+                    logger.error(f"Error generating embeddings: {str(e)}")
+                    self._record_embedding_failure()
+                    return batch_keys, [fallback] * len(batch_keys)
+            self._embedding_failures = 0
+            self._store_cached_embeddings(zip(batch_keys, batch_embeddings))
+            return batch_keys, batch_embeddings
+        
+        results = await asyncio.gather(*(
+            embed_batch(start) for start in range(0, len(missing_texts), self.EMBEDDING_BATCH_SIZE)
+        ))
+        for batch_keys, batch_embeddings in results:
+            embeddings.update(zip(batch_keys, batch_embeddings))
+        
+        return [embeddings[key] for key in keys]
+    
+    async def _agenerate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for one batch of texts with a single async Azure OpenAI request"""
+        response = await self.async_openai_client.embeddings.create(
+            input=texts,
+            model=self.embedding_deployment
+        )
+        # The API tags every embedding with the position of its input
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+    
+    def _embedding_circuit_open(self) -> bool:
+        """Whether embedding calls are currently being skipped after repeated failures"""
+        return time.monotonic() < self._embedding_circuit_open_until
+    
+    def _record_embedding_failure(self) -> None:
+        """Count a failed embeddings call, opening the circuit once the threshold is hit"""
+        self._embedding_failures += 1
+        if self._embedding_failures >= self.EMBEDDING_FAILURE_THRESHOLD:
+            self._embedding_failures = 0
+            self._embedding_circuit_open_until = time.monotonic() + self.EMBEDDING_COOLDOWN_SECONDS
+            logger.warning(
+                f"Embeddings failed {self.EMBEDDING_FAILURE_THRESHOLD} times in a row, "
+                f"skipping the API for {self.EMBEDDING_COOLDOWN_SECONDS}s"
             )
-            return response.data[0].embedding
-        except Exception as e:
-            logger.error(f"Error generating embedding: {str(e)}")
-            # Return a zero vector as fallback
-            return [0.0] * 1536  # text-embedding-3-small dimension
+    
+    def _split_cached_embeddings(self, texts: List[str]) -> Tuple[List[bytes], Dict[bytes, List[float]], Dict[bytes, str]]:
+        """
+        Look texts up in the embedding cache
+        
+        Returns:
+            Cache key per text, cached embeddings by key, and the distinct uncached texts by key
+        """
+        keys = [self._embedding_cache_key(text) for text in texts]
+        
+        # Only texts missing from the cache are sent to the API, each of them once
+        embeddings: Dict[bytes, List[float]] = {}
+        missing: Dict[bytes, str] = {}
+        with self._embedding_cache_lock:
+            for key, text in zip(keys, texts):
+                if key in self._embedding_cache:
+                    self._embedding_cache.move_to_end(key)
+                    embeddings[key] = self._embedding_cache[key]
+                elif key not in missing:
+                    missing[key] = text
+        
+        if missing and self._embedding_db is not None:
+            persisted = self._load_persisted_embeddings(list(missing))
+            if persisted:
+                self._store_cached_embeddings(persisted.items(), persist=False)
+                embeddings.update(persisted)
+                for key in persisted:
+                    del missing[key]
+        
+        return keys, embeddings, missing
+    
+    def _embedding_cache_key(self, text: str) -> bytes:
+        """
+        Cache key for a text embedded with the configured deployment
+        
+        The text is lowercased and its whitespace collapsed first, so texts that only
+        differ in case or spacing share one cached embedding.
+        """
+        normalized_text = " ".join(text.lower().split())
+        return hashlib.sha256(f"{self.embedding_deployment}\0{normalized_text}".encode()).digest()
+    
+    def _store_cached_embeddings(self, items, persist: bool = True) -> None:
+        """Add (key, embedding) pairs to the LRU cache, evicting the oldest entries"""
+        items = list(items)
+        with self._embedding_cache_lock:
+            for key, embedding in items:
+                self._embedding_cache[key] = embedding
+                self._embedding_cache.move_to_end(key)
+            while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+        
+        if persist and self._embedding_db is not None:
+            self._persist_embeddings(items)
+    
+    def _open_embedding_db(self, path: str) -> sqlite3.Connection:
+        """Open (and create if needed) the SQLite embedding cache"""
+        # Shared across Streamlit's threads; access is serialized by _embedding_db_lock
+        connection = sqlite3.connect(path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS emb (key BLOB PRIMARY KEY, vec BLOB NOT NULL)")
+        connection.commit()
+        logger.info(f"Using persistent embedding cache: {path}")
+        return connection
+    
+    def _load_persisted_embeddings(self, keys: List[bytes]) -> Dict[bytes, List[float]]:
+        """Read embeddings for the given cache keys from the SQLite cache"""
+        persisted = {}
+        try:
+            with self._embedding_db_lock:
+                # Stay below SQLite's default limit on bound parameters
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    rows = self._embedding_db.execute(
+                        f"SELECT key, vec FROM emb WHERE key IN ({', '.join('?' * len(chunk))})",
+                        chunk
+                    )
+                    for key, vec in rows:
+                        persisted[bytes(key)] = np.frombuffer(vec, dtype=np.float32).tolist()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading embedding cache: {str(e)}")
+        return persisted
+    
+    def _persist_embeddings(self, items: List[Tuple[bytes, List[float]]]) -> None:
+        """Write (key, embedding) pairs to the SQLite cache as float32 bytes"""
+        try:
+            with self._embedding_db_lock:
+                self._embedding_db.executemany(
+                    "INSERT OR REPLACE INTO emb (key, vec) VALUES (?, ?)",
+                    [(key, np.asarray(embedding, dtype=np.float32).tobytes()) for key, embedding in items]
+                )
+                self._embedding_db.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error writing embedding cache: {str(e)}")
     
     def add_tender(self, 
                    tender_data: Dict[str, Any], 
@@ -81,29 +584,11 @@ class CosmosDBVectorStore:
             Document ID
         """
         try:
-            # Generate unique ID if not provided
-            document_id = tender_data.get('id', str(uuid.uuid4()))
-            
-            # Create text for embedding
-            embedding_text = self._create_tender_embedding_text(tender_data)
-            
-            # Generate embedding
-            embedding = self._generate_embedding(embedding_text)
-            
-            # Prepare document
-            document = {
-                'id': document_id,
-                'type': 'tender',
-                'data': tender_data,
-                'metadata': metadata or {},
-                'embedding_text': embedding_text,
-                'embedding': embedding,
-                'created_at': tender_data.get('publication_date', ''),
-                'title': tender_data.get('title', ''),
-                'category': tender_data.get('category', []),
-                'location': tender_data.get('location', ''),
-                'estimated_value': tender_data.get('estimated_value', 0)
-            }
+            documents = self._prepare_tender_documents([tender_data], metadata)
+            if not documents:
+                raise ValueError("Tender document could not be prepared")
+            document = documents[0]
+            document_id = document['id']
             
             # Insert into container
             self.tenders_container.create_item(body=document)
@@ -115,6 +600,25 @@ class CosmosDBVectorStore:
             logger.error(f"Error adding tender document: {str(e)}")
             raise
     
+    def add_tenders_bulk(self, 
+                         tenders: List[Dict[str, Any]], 
+                         metadata: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Add several tender documents, embedding them all in one request
+        
+        Args:
+            tenders: Tender documents data
+            metadata: Additional metadata applied to every document
+            
+        Returns:
+            IDs of the documents that were inserted
+        """
+        if not tenders:
+            return []
+        
+        documents = self._prepare_tender_documents(tenders, metadata)
+        return self._create_documents(self.tenders_container, documents, "tender")
+    
     def add_company(self, 
                     company_data: Dict[str, Any], 
                     metadata: Optional[Dict[str, Any]] = None) -> str:
@@ -129,29 +633,11 @@ class CosmosDBVectorStore:
             Document ID
         """
         try:
-            # Generate unique ID if not provided
-            document_id = company_data.get('id', str(uuid.uuid4()))
-            
-            # Create text for embedding
-            embedding_text = self._create_company_embedding_text(company_data)
-            
-            # Generate embedding
-            embedding = self._generate_embedding(embedding_text)
-            
-            # Prepare document
-            document = {
-                'id': document_id,
-                'type': 'company',
-                'data': company_data,
-                'metadata': metadata or {},
-                'embedding_text': embedding_text,
-                'embedding': embedding,
-                'name': company_data.get('name', ''),
-                'industry': company_data.get('industry', []),
-                'services': company_data.get('services', []),
-                'location': company_data.get('location', ''),
-                'size': company_data.get('size', '')
-            }
+            documents = self._prepare_company_documents([company_data], metadata)
+            if not documents:
+                raise ValueError("Company document could not be prepared")
+            document = documents[0]
+            document_id = document['id']
             
             # Insert into container
             self.companies_container.create_item(body=document)
@@ -163,10 +649,264 @@ class CosmosDBVectorStore:
             logger.error(f"Error adding company document: {str(e)}")
             raise
     
+    def add_companies_bulk(self, 
+                           companies: List[Dict[str, Any]], 
+                           metadata: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Add several company documents, embedding them all in one request
+        
+        Args:
+            companies: Company documents data
+            metadata: Additional metadata applied to every document
+            
+        Returns:
+            IDs of the documents that were inserted
+        """
+        if not companies:
+            return []
+        
+        documents = self._prepare_company_documents(companies, metadata)
+        return self._create_documents(self.companies_container, documents, "company")
+    
+    async def aadd_tenders_bulk(self, 
+                                tenders: List[Dict[str, Any]], 
+                                metadata: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Async variant of add_tenders_bulk with concurrent embedding requests and writes
+        
+        Args:
+            tenders: Tender documents data
+            metadata: Additional metadata applied to every document
+            
+        Returns:
+            IDs of the documents that were inserted
+        """
+        if not tenders:
+            return []
+        
+        tenders, embedding_texts = self._embedding_texts(tenders, self._create_tender_embedding_text, "tender")
+        embeddings = await self._aembed_documents(tenders, embedding_texts)
+        documents = self._build_tender_documents(tenders, embedding_texts, embeddings, metadata)
+        return await self._acreate_documents(self.tenders_container, documents, "tender")
+    
+    async def aadd_companies_bulk(self, 
+                                  companies: List[Dict[str, Any]], 
+                                  metadata: Optional[Dict[str, Any]] = None) -> List[str]:
+        """
+        Async variant of add_companies_bulk with concurrent embedding requests and writes
+        
+        Args:
+            companies: Company documents data
+            metadata: Additional metadata applied to every document
+            
+        Returns:
+            IDs of the documents that were inserted
+        """
+        if not companies:
+            return []
+        
+        companies, embedding_texts = self._embedding_texts(companies, self._create_company_embedding_text, "company")
+        embeddings = await self._aembed_documents(companies, embedding_texts)
+        documents = self._build_company_documents(companies, embedding_texts, embeddings, metadata)
+        return await self._acreate_documents(self.companies_container, documents, "company")
+    
+    async def aadd_tender(self, 
+                          tender_data: Dict[str, Any], 
+                          metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Async variant of add_tender that keeps the event loop free while it runs"""
+        return await self._run_io(self.add_tender, tender_data, metadata)
+    
+    async def aadd_company(self, 
+                           company_data: Dict[str, Any], 
+                           metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Async variant of add_company that keeps the event loop free while it runs"""
+        return await self._run_io(self.add_company, company_data, metadata)
+    
+    def _embedding_texts(self, items: List[Dict[str, Any]], text_fn, kind: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Embedding texts for items, skipping the malformed ones so they can't fail the whole batch"""
+        kept, texts = [], []
+        for item in items:
+            try:
+                texts.append(text_fn(item))
+            except Exception as e:
+                logger.error(f"Skipping malformed {kind} document: {str(e)}")
+                continue
+            kept.append(item)
+        return kept, texts
+    
+    def _embed_documents(self, items: List[Dict[str, Any]], embedding_texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embeddings for items, generating only those the caller didn't supply
+        
+        Items that couldn't be embedded get None rather than the zero-vector fallback;
+        a stored zero vector is never found by search and a re-ingest would conflict.
+        """
+        embeddings = [_provided_embedding(item) for item in items]
+        pending = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if pending:
+            generated = self._generate_embeddings([embedding_texts[i] for i in pending], allow_fallback=False)
+            for i, embedding in zip(pending, generated):
+                embeddings[i] = embedding
+        return embeddings
+    
+    async def _aembed_documents(self, items: List[Dict[str, Any]], embedding_texts: List[str]) -> List[Optional[List[float]]]:
+        """Async variant of _embed_documents"""
+        embeddings = [_provided_embedding(item) for item in items]
+        pending = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if pending:
+            generated = await self._agenerate_embeddings([embedding_texts[i] for i in pending], allow_fallback=False)
+            for i, embedding in zip(pending, generated):
+                embeddings[i] = embedding
+        return embeddings
+    
+    def _prepare_tender_documents(self, 
+                                  tenders: List[Dict[str, Any]], 
+                                  metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Build tender documents, embedding all of them in one request"""
+        tenders, embedding_texts = self._embedding_texts(tenders, self._create_tender_embedding_text, "tender")
+        embeddings = self._embed_documents(tenders, embedding_texts)
+        return self._build_tender_documents(tenders, embedding_texts, embeddings, metadata)
+    
+    def _build_tender_documents(self, 
+                                tenders: List[Dict[str, Any]], 
+                                embedding_texts: List[str], 
+                                embeddings: List[Optional[List[float]]], 
+                                metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Build tender documents from already computed embeddings, skipping tenders without one"""
+        documents = []
+        metadata = metadata or {}
+        for tender_data, embedding_text, embedding in zip(tenders, embedding_texts, embeddings):
+            get = tender_data.get
+            if embedding is None:
+                logger.warning(f"Skipping tender document {get('id', '')}: no embedding available")
+                continue
+            try:
+                document = {
+                    # Generate unique ID if not provided
+                    'id': get('id') or str(uuid.uuid4()),
+                    'type': 'tender',
+                    'data': _without_embedding(tender_data),
+                    'metadata': metadata,
+                    'embedding': _to_float32_list(embedding),
+                    'created_at': get('publication_date', ''),
+                    'title': get('title', ''),
+                    'category': get('category', []),
+                    'location': get('location', ''),
+                    'estimated_value': get('estimated_value', 0)
+                }
+            except Exception as e:
+                logger.error(f"Skipping malformed tender document {get('id', '')}: {str(e)}")
+                continue
+            
+            # The text can be rebuilt from 'data', so it is only stored when asked for
+            if self.store_embedding_text:
+                document['embedding_text'] = embedding_text
+            documents.append(document)
+        
+        return documents
+    
+    def _prepare_company_documents(self, 
+                                   companies: List[Dict[str, Any]], 
+                                   metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Build company documents, embedding all of them in one request"""
+        companies, embedding_texts = self._embedding_texts(companies, self._create_company_embedding_text, "company")
+        embeddings = self._embed_documents(companies, embedding_texts)
+        return self._build_company_documents(companies, embedding_texts, embeddings, metadata)
+    
+    def _build_company_documents(self, 
+                                 companies: List[Dict[str, Any]], 
+                                 embedding_texts: List[str], 
+                                 embeddings: List[Optional[List[float]]], 
+                                 metadata: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Build company documents from already computed embeddings, skipping companies without one"""
+        documents = []
+        for company_data, embedding_text, embedding in zip(companies, embedding_texts, embeddings):
+            if embedding is None:
+                logger.warning(f"Skipping company document {company_data.get('id', '')}: no embedding available")
+                continue
+            try:
+                document = {
+                    # Generate unique ID if not provided
+                    'id': company_data.get('id') or str(uuid.uuid4()),
+                    'type': 'company',
+                    'data': _without_embedding(company_data),
+                    'metadata': metadata or {},
+                    'embedding': _to_float32_list(embedding),
+                    'name': company_data.get('name', ''),
+                    'industry': company_data.get('industry', []),
+                    'services': company_data.get('services', []),
+                    'location': company_data.get('location', ''),
+                    'size': company_data.get('size', '')
+                }
+            except Exception as e:
+                logger.error(f"Skipping malformed company document {company_data.get('id', '')}: {str(e)}")
+                continue
+            
+            # The text can be rebuilt from 'data', so it is only stored when asked for
+            if self.store_embedding_text:
+                document['embedding_text'] = embedding_text
+            documents.append(document)
+        
+        return documents
+    
+    def _create_documents(self, container, documents: List[Dict[str, Any]], kind: str) -> List[str]:
+        """Insert prepared documents in transactional batches, skipping the ones that fail"""
+        document_ids = []
+        for start in range(0, len(documents), self.WRITE_BATCH_SIZE):
+            document_ids.extend(self._create_document_batch(container, documents[start:start + self.WRITE_BATCH_SIZE], kind))
+        
+        logger.info(f"Added {len(document_ids)} of {len(documents)} {kind} documents")
+        return document_ids
+    
+    async def _acreate_documents(self, container, documents: List[Dict[str, Any]], kind: str) -> List[str]:
+        """Insert prepared documents with the batches written concurrently, skipping the ones that fail"""
+        # The Cosmos container client is synchronous, so the writes run on the I/O pool
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(
+                _IO_POOL,
+                partial(self._create_document_batch, container, documents[start:start + self.WRITE_BATCH_SIZE], kind)
+            )
+            for start in range(0, len(documents), self.WRITE_BATCH_SIZE)
+        ))
+        
+        document_ids = [document_id for batch_ids in results for document_id in batch_ids]
+        logger.info(f"Added {len(document_ids)} of {len(documents)} {kind} documents")
+        return document_ids
+    
+    def _create_document_batch(self, container, documents: List[Dict[str, Any]], kind: str) -> List[str]:
+        """
+        Insert documents with one transactional batch, falling back to single inserts
+        
+        Every document in a container shares the partition key value kind, so one batch
+        covers them all. The batch is all-or-nothing; if it fails (e.g. one duplicate id)
+        the documents are retried one by one so only the failing ones are skipped.
+        """
+        try:
+            container.execute_item_batch(
+                batch_operations=[("create", (document,)) for document in documents],
+                partition_key=kind
+            )
+            return [document['id'] for document in documents]
+        except Exception as e:
+            logger.warning(f"Batch insert of {len(documents)} {kind} documents failed, inserting individually: {str(e)}")
+        
+        document_ids = []
+        for document in documents:
+            try:
+                container.create_item(body=document)
+                document_ids.append(document['id'])
+            except Exception as e:
+                logger.error(f"Error adding {kind} document {document['id']}: {str(e)}")
+        
+        return document_ids
+    
     def search_tenders(self, 
                        query: str, 
                        limit: int = 10,
-                       filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+                       filters: Optional[Dict[str, Any]] = None,
+                       include_full: bool = False,
+                       ids_only: bool = False) -> List[Dict[str, Any]]:
         """
         Search for similar tenders using vector similarity
         
@@ -174,6 +914,8 @@ class CosmosDBVectorStore:
             query: Search query
             limit: Maximum number of results
             filters: Additional filters
+            include_full: Also return the full tender record under 'data'
+            ids_only: Return only ids and similarity scores, e.g. to rank before fetching records
             
         Returns:
             List of similar tender documents with similarity scores
@@ -182,34 +924,7 @@ class CosmosDBVectorStore:
             # Generate embedding for query
             query_embedding = self._generate_embedding(query)
             
-            # Build SQL query with vector search
-            sql_query = """
-            SELECT 
-                c.id,
-                c.data,
-                c.metadata,
-                c.title,
-                c.category,
-                c.location,
-                c.estimated_value,
-                VectorDistance(c.embedding, @queryVector) AS similarity_score
-            FROM c 
-            WHERE c.type = 'tender'
-            ORDER BY VectorDistance(c.embedding, @queryVector)
-            OFFSET 0 LIMIT @limit
-            """
-            
-            parameters = [
-                {"name": "@queryVector", "value": query_embedding},
-                {"name": "@limit", "value": limit}
-            ]
-            
-            # Execute query
-            items = list(self.tenders_container.query_items(
-                query=sql_query,
-                parameters=parameters,
-                enable_cross_partition_query=True
-            ))
+            items = self._query_similar_tenders(query_embedding, limit, _search_projection(include_full, ids_only))
             
             logger.info(f"Found {len(items)} similar tenders for query: {query}")
             return items
@@ -218,15 +933,54 @@ class CosmosDBVectorStore:
             logger.error(f"Error searching tenders: {str(e)}")
             return []
     
+    def search_tenders_batch(self, 
+                             queries: List[str], 
+                             limit: int = 10,
+                             include_full: bool = False,
+                             ids_only: bool = False) -> List[List[Dict[str, Any]]]:
+        """
+        Search for similar tenders for several queries at once
+        
+        All queries are embedded with one request and the vector searches run concurrently.
+        
+        Args:
+            queries: Search queries
+            limit: Maximum number of results per query
+            include_full: Also return the full tender records under 'data'
+            ids_only: Return only ids and similarity scores
+            
+        Returns:
+            One list of similar tender documents per query, in query order
+        """
+        if not queries:
+            return []
+        
+        try:
+            query_embeddings = self._generate_embeddings(queries)
+            results = self._run_vector_searches(
+                self._query_similar_tenders, query_embeddings, limit, _search_projection(include_full, ids_only)
+            )
+            
+            logger.info(f"Found {sum(len(items) for items in results)} similar tenders for {len(queries)} queries")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error searching tenders: {str(e)}")
+            return [[] for _ in queries]
+    
     def search_companies(self, 
                          query: str, 
-                         limit: int = 10) -> List[Dict[str, Any]]:
+                         limit: int = 10,
+                         include_full: bool = False,
+                         ids_only: bool = False) -> List[Dict[str, Any]]:
         """
         Search for similar companies using vector similarity
         
         Args:
             query: Search query
             limit: Maximum number of results
+            include_full: Also return the full company record under 'data'
+            ids_only: Return only ids and similarity scores, e.g. to rank before fetching records
             
         Returns:
             List of similar company documents with similarity scores
@@ -235,35 +989,7 @@ class CosmosDBVectorStore:
             # Generate embedding for query
             query_embedding = self._generate_embedding(query)
             
-            # Build SQL query with vector search
-            sql_query = """
-            SELECT 
-                c.id,
-                c.data,
-                c.metadata,
-                c.name,
-                c.industry,
-                c.services,
-                c.location,
-                c.size,
-                VectorDistance(c.embedding, @queryVector) AS similarity_score
-            FROM c 
-            WHERE c.type = 'company'
-            ORDER BY VectorDistance(c.embedding, @queryVector)
-            OFFSET 0 LIMIT @limit
-            """
-            
-            parameters = [
-                {"name": "@queryVector", "value": query_embedding},
-                {"name": "@limit", "value": limit}
-            ]
-            
-            # Execute query
-            items = list(self.companies_container.query_items(
-                query=sql_query,
-                parameters=parameters,
-                enable_cross_partition_query=True
-            ))
+            items = self._query_similar_companies(query_embedding, limit, _search_projection(include_full, ids_only))
             
             logger.info(f"Found {len(items)} similar companies for query: {query}")
             return items
@@ -272,10 +998,130 @@ class CosmosDBVectorStore:
             logger.error(f"Error searching companies: {str(e)}")
             return []
     
+    def search_companies_batch(self, 
+                               queries: List[str], 
+                               limit: int = 10,
+                               include_full: bool = False,
+                               ids_only: bool = False) -> List[List[Dict[str, Any]]]:
+        """
+        Search for similar companies for several queries at once
+        
+        All queries are embedded with one request and the vector searches run concurrently.
+        
+        Args:
+            queries: Search queries
+            limit: Maximum number of results per query
+            include_full: Also return the full company records under 'data'
+            ids_only: Return only ids and similarity scores
+            
+        Returns:
+            One list of similar company documents per query, in query order
+        """
+        if not queries:
+            return []
+        
+        try:
+            query_embeddings = self._generate_embeddings(queries)
+            results = self._run_vector_searches(
+                self._query_similar_companies, query_embeddings, limit, _search_projection(include_full, ids_only)
+            )
+            
+            logger.info(f"Found {sum(len(items) for items in results)} similar companies for {len(queries)} queries")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error searching companies: {str(e)}")
+            return [[] for _ in queries]
+    
+    async def asearch_tenders(self, 
+                              query: str, 
+                              limit: int = 10,
+                              filters: Optional[Dict[str, Any]] = None,
+                              include_full: bool = False,
+                              ids_only: bool = False) -> List[Dict[str, Any]]:
+        """Async variant of search_tenders that keeps the event loop free while it runs"""
+        return await self._run_io(
+            self.search_tenders, query, limit, filters, include_full=include_full, ids_only=ids_only
+        )
+    
+    async def asearch_companies(self, 
+                                query: str, 
+                                limit: int = 10,
+                                include_full: bool = False,
+                                ids_only: bool = False) -> List[Dict[str, Any]]:
+        """Async variant of search_companies that keeps the event loop free while it runs"""
+        return await self._run_io(
+            self.search_companies, query, limit, include_full=include_full, ids_only=ids_only
+        )
+    
+    async def _run_io(self, fn, *args, **kwargs):
+        """Run a blocking store call on the shared I/O pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_IO_POOL, partial(fn, *args, **kwargs))
+    
+    def _run_vector_searches(self, 
+                             search_fn, 
+                             query_embeddings: List[List[float]], 
+                             limit: int, 
+                             projection: str) -> List[List[Dict[str, Any]]]:
+        """Run one vector search per embedding concurrently, keeping the input order"""
+        if len(query_embeddings) == 1:
+            return [search_fn(query_embeddings[0], limit, projection)]
+        
+        with ThreadPoolExecutor(max_workers=min(len(query_embeddings), self.SEARCH_MAX_WORKERS)) as executor:
+            return list(executor.map(
+                lambda query_embedding: search_fn(query_embedding, limit, projection),
+                query_embeddings
+            ))
+    
+    def _query_similar_tenders(self, 
+                               query_embedding: List[float], 
+                               limit: int, 
+                               projection: str = "summary") -> List[Dict[str, Any]]:
+        """Run the tender vector search for one query embedding"""
+        # Prebuilt SQL for the requested projection
+        sql_query = _TENDER_SEARCH_SQL[projection]
+        
+        parameters = [
+            {"name": "@queryVector", "value": _to_float32_list(query_embedding)},
+            {"name": "@limit", "value": limit}
+        ]
+        
+        # Execute query; islice stops after limit items without asking for another page
+        return list(islice(self.tenders_container.query_items(
+            query=sql_query,
+            parameters=parameters,
+            partition_key="tender",
+            # Fetch the whole result in one page instead of the SDK's default page size
+            max_item_count=limit
+        ), limit))
+    
+    def _query_similar_companies(self, 
+                                 query_embedding: List[float], 
+                                 limit: int, 
+                                 projection: str = "summary") -> List[Dict[str, Any]]:
+        """Run the company vector search for one query embedding"""
+        # Prebuilt SQL for the requested projection
+        sql_query = _COMPANY_SEARCH_SQL[projection]
+        
+        parameters = [
+            {"name": "@queryVector", "value": _to_float32_list(query_embedding)},
+            {"name": "@limit", "value": limit}
+        ]
+        
+        # Execute query; islice stops after limit items without asking for another page
+        return list(islice(self.companies_container.query_items(
+            query=sql_query,
+            parameters=parameters,
+            partition_key="company",
+            # Fetch the whole result in one page instead of the SDK's default page size
+            max_item_count=limit
+        ), limit))
+    
     def get_tender_by_id(self, tender_id: str) -> Optional[Dict[str, Any]]:
         """Get a tender by ID"""
         try:
-            item = self.tenders_container.read_item(item=tender_id, partition_key=tender_id)
+            item = self.tenders_container.read_item(item=tender_id, partition_key="tender")
             return item
         except CosmosResourceNotFoundError:
             return None
@@ -286,7 +1132,7 @@ class CosmosDBVectorStore:
     def get_company_by_id(self, company_id: str) -> Optional[Dict[str, Any]]:
         """Get a company by ID"""
         try:
-            item = self.companies_container.read_item(item=company_id, partition_key=company_id)
+            item = self.companies_container.read_item(item=company_id, partition_key="company")
             return item
         except CosmosResourceNotFoundError:
             return None
@@ -294,19 +1140,69 @@ class CosmosDBVectorStore:
             logger.error(f"Error getting company by ID {company_id}: {str(e)}")
             return None
     
-    def get_all_tenders(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get all tenders with optional limit"""
+    def get_tenders_by_ids(self, tender_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get several tenders by ID in as few round trips as possible
+        
+        Args:
+            tender_ids: IDs of the tenders to read
+            
+        Returns:
+            Tenders found, in the order of tender_ids; missing IDs are skipped
+        """
         try:
-            sql_query = "SELECT * FROM c WHERE c.type = 'tender' ORDER BY c._ts DESC OFFSET 0 LIMIT @limit"
-            parameters = [{"name": "@limit", "value": limit}]
+            return self._read_items(self.tenders_container, tender_ids, "tender")
+        except Exception as e:
+            logger.error(f"Error getting tenders by ID: {str(e)}")
+            return []
+    
+    def get_companies_by_ids(self, company_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get several companies by ID in as few round trips as possible
+        
+        Args:
+            company_ids: IDs of the companies to read
             
-            items = list(self.tenders_container.query_items(
-                query=sql_query,
-                parameters=parameters,
-                enable_cross_partition_query=True
-            ))
+        Returns:
+            Companies found, in the order of company_ids; missing IDs are skipped
+        """
+        try:
+            return self._read_items(self.companies_container, company_ids, "company")
+        except Exception as e:
+            logger.error(f"Error getting companies by ID: {str(e)}")
+            return []
+    
+    def _read_items(self, container, ids: List[str], kind: str) -> List[Dict[str, Any]]:
+        """Batched point reads within one partition, preserving the requested order"""
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return []
+        
+        if hasattr(container, "read_items"):
+            # azure-cosmos >= 4.14 groups the reads into a few multi-item requests
+            items = container.read_items(
+                items=[(item_id, kind) for item_id in ids],
+                max_concurrency=self.READ_MAX_CONCURRENCY
+            )
+        else:
+            def read_one(item_id: str) -> Optional[Dict[str, Any]]:
+                try:
+                    return container.read_item(item=item_id, partition_key=kind)
+                except CosmosResourceNotFoundError:
+                    return None
             
-            return items
+            with ThreadPoolExecutor(max_workers=min(len(ids), self.READ_MAX_CONCURRENCY)) as executor:
+                items = [item for item in executor.map(read_one, ids) if item is not None]
+        
+        # read_items gives no ordering guarantee
+        by_id = {item["id"]: item for item in items}
+        return [by_id[item_id] for item_id in ids if item_id in by_id]
+    
+    def get_all_tenders(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get all tenders with optional limit"""
+        try:
+            # A page size of limit means only the first page is ever requested
+            return list(islice(self.iter_tenders(page_size=limit), limit))
         except Exception as e:
             logger.error(f"Error getting all tenders: {str(e)}")
             return []
@@ -314,71 +1210,48 @@ class CosmosDBVectorStore:
     def get_all_companies(self, limit: int = 100) -> List[Dict[str, Any]]:
         """Get all companies with optional limit"""
         try:
-            sql_query = "SELECT * FROM c WHERE c.type = 'company' ORDER BY c._ts DESC OFFSET 0 LIMIT @limit"
-            parameters = [{"name": "@limit", "value": limit}]
-            
-            items = list(self.companies_container.query_items(
-                query=sql_query,
-                parameters=parameters,
-                enable_cross_partition_query=True
-            ))
-            
-            return items
+            # A page size of limit means only the first page is ever requested
+            return list(islice(self.iter_companies(page_size=limit), limit))
         except Exception as e:
             logger.error(f"Error getting all companies: {str(e)}")
             return []
     
-    def _create_tender_embedding_text(self, tender_data: Dict[str, Any]) -> str:
-        """Create text representation for tender embedding"""
-        parts = []
-        
-        if 'title' in tender_data:
-            parts.append(f"Title: {tender_data['title']}")
-        
-        if 'description' in tender_data:
-            parts.append(f"Description: {tender_data['description']}")
-        
-        if 'category' in tender_data and tender_data['category']:
-            categories = tender_data['category'] if isinstance(tender_data['category'], list) else [tender_data['category']]
-            parts.append(f"Categories: {', '.join(categories)}")
-        
-        if 'organization' in tender_data:
-            parts.append(f"Organization: {tender_data['organization']}")
-        
-        if 'location' in tender_data:
-            parts.append(f"Location: {tender_data['location']}")
+    def iter_tenders(self, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Stream tenders, newest first, fetching one page at a time
         
-        if 'estimated_value' in tender_data and tender_data['estimated_value']:
-            parts.append(f"Estimated Value: {tender_data['estimated_value']}")
+        Args:
+            page_size: Items requested per round trip
+            
+        Returns:
+            Iterator over tender documents (without their embeddings)
+        """
+        yield from self.tenders_container.query_items(
+            query=_TENDER_LIST_SQL,
+            partition_key="tender",
+            max_item_count=page_size
+        )
+    
+    def iter_companies(self, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Stream companies, newest first, fetching one page at a time
         
-        return " | ".join(parts)
+        Args:
+            page_size: Items requested per round trip
+            
+        Returns:
+            Iterator over company documents (without their embeddings)
+        """
+        yield from self.companies_container.query_items(
+            query=_COMPANY_LIST_SQL,
+            partition_key="company",
+            max_item_count=page_size
+        )
+    
+    def _create_tender_embedding_text(self, tender_data: Dict[str, Any]) -> str:
+        """Create text representation for tender embedding"""
+        return _build_embedding_text(tender_data, _TENDER_TEXT_FIELDS)
     
     def _create_company_embedding_text(self, company_data: Dict[str, Any]) -> str:
         """Create text representation for company embedding"""
-        parts = []
-        
-        if 'name' in company_data:
-            parts.append(f"Company: {company_data['name']}")
-        
-        if 'description' in company_data:
-            parts.append(f"Description: {company_data['description']}")
-        
-        if 'industry' in company_data and company_data['industry']:
-            industries = company_data['industry'] if isinstance(company_data['industry'], list) else [company_data['industry']]
-            parts.append(f"Industries: {', '.join(industries)}")
-        
-        if 'services' in company_data and company_data['services']:
-            services = company_data['services'] if isinstance(company_data['services'], list) else [company_data['services']]
-            parts.append(f"Services: {', '.join(services)}")
-        
-        if 'expertise' in company_data and company_data['expertise']:
-            expertise = company_data['expertise'] if isinstance(company_data['expertise'], list) else [company_data['expertise']]
-            parts.append(f"Expertise: {', '.join(expertise)}")
-        
-        if 'location' in company_data:
-            parts.append(f"Location: {company_data['location']}")
-        
-        if 'size' in company_data:
-            parts.append(f"Size: {company_data['size']}")
-        
-        return " | ".join(parts)
+        return _build_embedding_text(company_data, _COMPANY_TEXT_FIELDS)